@@ -0,0 +1,15 @@
+# Build-time feature flags and pin assignments, shared by the CLI and GUI.
+# These stay module-level constants (not runtime options) so `if DEV_MODE:`
+# style branches are decided once at import.
+
+# Development mode toggle: when True, use MockFactory for gpiozero pins and
+# enable the Dummy I2C bus emulation in `motor_control` by passing DEV_MODE
+# into `init_bus`.
+DEV_MODE = False
+
+# GUI vs Terminal toggle: set to True to launch the PySide6 GUI instead of CLI
+GUI_MODE = False
+
+# --- E-STOP CONFIGURATION ---
+E_STOP_PIN = 23
+E_STOP_SOURCE = 24
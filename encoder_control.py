@@ -1,6 +1,9 @@
+import logging
 import time
 import struct
-from smbus2 import SMBus, i2c_msg
+import numpy as np
+
+log = logging.getLogger(__name__)
 
 # --- PICO 2 CONFIGURATION ---
 PICO2_ADDR = 0x60 # 96 Decimal
@@ -15,8 +18,46 @@ STATUS_READY = 0x33
 STATUS_CHUNK = 0x34
 STATUS_SINGLE_SHOT_READY = 0x35
 
+# Statuses accepted by the chunk download loop. A frozenset keeps the hot
+# check a single membership test even if more chunk variants (e.g. a
+# "last, partial" status) are added later.
+_OK_CHUNK = frozenset({STATUS_CHUNK})
+
 I2C_BUFFER_SIZE = 6
 
+# Bulk chunk sizing: SMBus block transfers carry at most 32 bytes, so each
+# CMD_READ_CHUNK response packs [status, payload_len, data...] with up to
+# 28 data bytes (7 int32 samples) -- 7x fewer round-trips than 4 bytes/read.
+CHUNK_DATA_BYTES = 28
+CHUNK_BLOCK_SIZE = CHUNK_DATA_BYTES + 2
+
+# Pre-compiled command layouts so the hot paths don't allocate and
+# index-assign a fresh 6-byte bytearray per call
+_ARM_STRUCT = struct.Struct('<BB4x')  # [CMD, samples, 4 pad bytes]
+
+# Optional "data ready" line from Pico 2. When wired (firmware raises the
+# pin once the capture buffer is filled) and configured here, the host
+# sleeps on the GPIO edge instead of polling the status byte -- zero CPU
+# during the wait and sub-ms wakeup. Leave as None if the line isn't wired.
+READY_PIN = None
+_ready_line = None
+
+
+def wait_for_data_ready(timeout=5.0):
+    """
+    Blocks until the Pico 2 ready GPIO goes active, or until `timeout`
+    seconds pass. Returns True if the line is active (or no ready pin is
+    configured, in which case status polling is the caller's fallback).
+    """
+    global _ready_line
+    if READY_PIN is None:
+        return True
+    if _ready_line is None:
+        from gpiozero import DigitalInputDevice
+        _ready_line = DigitalInputDevice(READY_PIN)
+    _ready_line.wait_for_active(timeout=timeout)
+    return _ready_line.is_active
+
 def read_single_sample(i2c_bus):
     """
     Asks Pico 2 to read the SPI encoder exactly once and return the value.
@@ -24,24 +65,26 @@ def read_single_sample(i2c_bus):
     """
     try:
         # 1. Send the Single Shot Command
-        # buf = bytearray(6)
-        # buf[0] = CMD_SINGLE_SHOT
-        # print("Sending Command to PICO2: " & buf)
-        # i2c_bus.write_i2c_block_data(PICO2_ADDR, 0, buf)
-        
         i2c_bus.write_byte_data(PICO2_ADDR, 0, CMD_SINGLE_SHOT)
-        
-        # Wait 10ms for Pico to perform the SPI Triple-Read
-        time.sleep(0.01)
-        
-        # Read back 5 bytes (Status [0] + 4 bytes of integer [1-4])
-        block = i2c_bus.read_i2c_block_data(PICO2_ADDR, 0, 5) 
-        status = block[0]
+
+        # Read back immediately -- the Pico clock-stretches SCL while it
+        # performs the SPI Triple-Read, so the old fixed 10 ms sleep only
+        # added latency. Poll briefly in case the firmware releases the
+        # bus before the sample is staged.
+        deadline = time.monotonic() + 0.01
+        while True:
+            # Read back 5 bytes (Status [0] + 4 bytes of integer [1-4])
+            block = i2c_bus.read_i2c_block_data(PICO2_ADDR, 0, 5)
+            status = block[0]
+            if status == STATUS_SINGLE_SHOT_READY or time.monotonic() >= deadline:
+                break
+            time.sleep(0.0005)
         
         if status == STATUS_SINGLE_SHOT_READY:
-            # < : Little Endian (Standard for ARM/Pico)
-            # i : Signed Integer (Allows you to see -1 error codes)
-            val = struct.unpack('<i', bytes(block[1:5]))[0]
+            # Little-endian signed (standard for ARM/Pico; signed=True keeps
+            # -1 error codes visible). int.from_bytes accepts the list of
+            # ints smbus returns directly -- no intermediate bytes() copy.
+            val = int.from_bytes(block[1:5], 'little', signed=True)
             
             # Convert the raw 12 bit angle into degrees
             if val < 2049:
@@ -52,117 +95,130 @@ def read_single_sample(i2c_bus):
                 
             return val
         elif status == STATUS_ENCODER_IDLE:
-            print(f"[Encoder] Encoder is idle. Status: {hex(status)}")
+            log.warning("Encoder is idle. Status: %#x", status)
             return None
         else:
-            print(f"[Encoder] Single shot failed. Status: {hex(status)}")
+            log.warning("Single shot failed. Status: %#x", status)
             return None
     except OSError:
-        print("[Encoder] I2C Error during single shot.")
+        log.error("I2C Error during single shot.")
         return None
 
-def arm_encoder(i2c_bus, samples: int = None):
+def arm_encoder(i2c_bus, samples: int = 200):
     """
     Sends the command to Pico 2 to arm the trigger and prepare for recording.
+    Callers own any prompting; this function never blocks on stdin, so it
+    stays usable from the GUI, scripts, and benchmarking harnesses.
     """
     try:
-        if samples is None:
-            samples = int(input("Enter number of samples to record (default 200): ") or "200")
+        log.info("Sending ARM command to Pico 2 (%d samples)...", samples)
         
-        print(f"[Encoder] Sending ARM command to Pico 2 ({samples} samples)...")
-        
-        # Protocol: [CMD, NUM_SAMPLES]
-        buf = bytearray(6)
-        buf[0] = CMD_RECORD
-        buf[1] = samples
-        i2c_bus.write_i2c_block_data(PICO2_ADDR, 0, buf)
+        # Protocol: [CMD, NUM_SAMPLES] padded to the 6-byte buffer
+        i2c_bus.write_i2c_block_data(PICO2_ADDR, 0, list(_ARM_STRUCT.pack(CMD_RECORD, samples)))
         
         time.sleep(0.1) 
-        print("[Encoder] Armed. Waiting for triggers...")
+        log.info("Armed. Waiting for triggers...")
         return True
     except OSError:
-        print("[Encoder] Error: Could not communicate with Pico 2. Check wiring/Address.")
+        log.error("Could not communicate with Pico 2. Check wiring/Address.")
         return False
 
+def _request_chunk(i2c_bus, offset):
+    """Sends CMD_READ_CHUNK for the given byte offset (no read)."""
+    lsb = offset & 0xFF
+    msb = (offset >> 8) & 0xFF
+    i2c_bus.write_i2c_block_data(PICO2_ADDR, 0x00, [CMD_READ_CHUNK, lsb, msb])
+
+
 def read_encoder_data(i2c_bus):
     """
-    Polls Pico 2 for status. If ready, downloads data in 4-byte chunks
-    and reconstructs the list of integers.
+    Polls Pico 2 for status. If ready, downloads the recorded samples and
+    returns them as a numpy array of angles in degrees (float64). Returning
+    the array directly avoids boxing every sample into a Python int just
+    for the FFT / curve fit to convert them straight back.
     """
     try:
-        # 1. Check Status
+        # 1. Check Status (after the ready line fires, if one is wired)
+        if not wait_for_data_ready():
+            log.error("Timed out waiting for the data-ready line.")
+            return []
         status_block = i2c_bus.read_i2c_block_data(PICO2_ADDR, 0, 6)
         status = status_block[0]
         
         if status == STATUS_CAPTURING:
-            print("[Encoder] Pico 2 is still capturing/processing data. Try again later.")
+            log.info("Pico 2 is still capturing/processing data. Try again later.")
             return []
             
         elif status == STATUS_READY:
             # 2. Parse Total Size (Bytes 1 and 2)
             total_bytes = status_block[1] | (status_block[2] << 8)
-            print(f"[Encoder] Data Ready! Total bytes to read: {total_bytes}")
+            log.info("Data Ready! Total bytes to read: %d", total_bytes)
             
-            collected_bytes = bytearray()
+            # Pre-size the buffer once; slice-assignment below avoids the
+            # amortized reallocations that per-chunk extend() would trigger
+            collected_bytes = bytearray(total_bytes)
             offset = 0
             
-            # 3. Chunk Loop
+            # 3. Chunk Loop -- pipelined: the request for chunk N+1 goes out
+            # before chunk N is stored, so the Pico fills its TX buffer
+            # while the host does its bookkeeping. Clock stretching covers
+            # the case where the host catches up before the fill completes,
+            # so there is still no sleep anywhere in the loop.
+            _request_chunk(i2c_bus, 0)
             while offset < total_bytes:
-                # Request chunk at specific offset
-                lsb = offset & 0xFF
-                msb = (offset >> 8) & 0xFF
-                i2c_bus.write_i2c_block_data(PICO2_ADDR, 0x00, [CMD_READ_CHUNK, lsb, msb])
-                
-                # Give Pico a tiny moment to fill buffer
-                time.sleep(0.005) 
-                
-                # Read response
-                # read_msg = i2c_msg.read(PICO2_ADDR, 6)
-                # i2c_bus.i2c_rdwr(read_msg)
-                # chunk_block = list(read_msg)
-            
-                chunk_block = i2c_bus.read_i2c_block_data(PICO2_ADDR, 0, 6)
+                chunk_block = i2c_bus.read_i2c_block_data(PICO2_ADDR, 0, CHUNK_BLOCK_SIZE)
                 chunk_status = chunk_block[0]
-                
-                if chunk_status == STATUS_CHUNK:
-                    # Bytes 1-4 are the data
-                    collected_bytes.extend(chunk_block[1:5])
-                    offset += 4
+
+                if chunk_status in _OK_CHUNK:
+                    # Byte 1 is the payload length, bytes 2.. are the data
+                    payload_len = chunk_block[1]
+                    if not 0 < payload_len <= CHUNK_DATA_BYTES:
+                        log.error("Bad payload length %d at offset %d.", payload_len, offset)
+                        break
+                    next_offset = offset + payload_len
+                    if next_offset < total_bytes:
+                        _request_chunk(i2c_bus, next_offset)
+                    collected_bytes[offset:offset + payload_len] = chunk_block[2:2 + payload_len]
+                    offset = next_offset
                 else:
-                    print(f"[Encoder] Error reading chunk at offset {offset}. Status: {hex(chunk_status)}")
+                    log.error("Error reading chunk at offset %d. Status: %#x", offset, chunk_status)
                     break
             
             # 4. Unpack Bytes to Integers
-            count = len(collected_bytes) // 4
-            
-            # CHANGE 2: Used '<' for Little Endian and 'i' for Signed Int
-            raw_val = struct.unpack(f'<{count}i', collected_bytes)
-            
-            angles_deg = []
-            for val in raw_val: # Convert the raw 12 bit angle into degrees
-                if val < 2049:
-                    angle = val*(360/4096)
-                else:
-                    angle = (val-4096)*(360/4096)
-                angles_deg.append(angle)
-                
+            # frombuffer gives a zero-copy int32 view of the payload --
+            # no per-element Python int boxing like struct.unpack + list
+            # `offset` is how far the loop actually filled, so a partial
+            # download still decodes only the bytes that arrived
+            count = offset // 4
+            raw_val = np.frombuffer(bytes(collected_bytes), dtype='<i4', count=count)
+
+            # Convert the raw 12 bit angle into degrees (vectorized)
+            angles_deg = np.where(raw_val < 2049, raw_val, raw_val - 4096) * (360 / 4096)
+
             return angles_deg
             
         else:
-            print(f"[Encoder] Pico 2 reported unexpected status: {hex(status)}")
+            log.warning("Pico 2 reported unexpected status: %#x", status)
             return []
             
     except OSError as e:
-        print(f"[Encoder] I2C Communication Error: {e}")
+        log.error("I2C Communication Error: %s", e)
         return []
     
     
     
 if __name__ == "__main__":
+    # Bus construction is centralized in motor_control.init_bus(); even
+    # this standalone demo goes through it so SMBus(1) is opened in
+    # exactly one place.
+    import motor_control
+
+    logging.basicConfig(level=logging.INFO)
     print("Opening I2C Bus")
-    try:
-        with SMBus(1) as bus:
+    bus = motor_control.init_bus()
+    if bus:
+        try:
             val = read_single_sample(bus)
             print(val)
-    except FileNotFoundError:
-        print("IDK")
+        finally:
+            motor_control.close_bus(bus)
@@ -1,10 +1,99 @@
 from PySide6 import QtCore, QtWidgets, QtGui
+from PySide6.QtCore import Slot
+import collections
+import functools
 import sys
+import numpy as np
 import motor_control
 import encoder_control
 import save_data_to_csv
 
 
+# Single application stylesheet. Widget state changes flip a dynamic
+# property and re-polish instead of calling setStyleSheet per instance,
+# which would re-parse the CSS and re-polish the widget subtree each time.
+_APP_STYLESHEET = """
+QLabel#led { background: gray; border-radius: 14px; }
+QLabel#led[state="green"]  { background: #2ecc71; }
+QLabel#led[state="red"]    { background: #e74c3c; }
+QLabel#led[state="orange"] { background: #f39c12; }
+QLabel#led[state="grey"]   { background: #7f8c8d; }
+QLabel#indText { color: #e6e6e6; }
+QLabel#dirSymbol { background: transparent; color: #e6e6e6; padding: 4px; }
+QLabel#dirSymbol[selected="true"] { background: #2e86de; color: white; border-radius: 8px; }
+QLabel#dirText { font-weight: normal; color: #cfcfcf; }
+QLabel#dirText[selected="true"] { font-weight: bold; color: #ffffff; }
+QLabel#versionLabel { color: #9aa0a6; }
+QLabel#rangeLabel { color: #cfcfcf; }
+QPushButton#startBtn { background: #27ae60; color: white; font-weight: bold; }
+QPushButton#stopBtn { background: #34495e; color: white; font-weight: bold; }
+QPushButton#estopBtn { background: #b30000; color: white; font-weight: bold; font-size: 16px; }
+QPushButton#estopBtn[engaged="true"] { background: #ff3333; }
+"""
+
+
+# Shared fonts. QFont is implicitly shared/ref-counted, so one instance
+# per role is safe to hand to any number of widgets and avoids repeated
+# construction + font-database lookups when widgets are (re)built.
+_SYM_FONT = QtGui.QFont()
+_SYM_FONT.setPointSize(20)
+_SYM_FONT.setBold(True)
+_TEXT_FONT = QtGui.QFont()
+_TEXT_FONT.setPointSize(10)
+_TITLE_FONT = QtGui.QFont()
+_TITLE_FONT.setPointSize(18)
+_TITLE_FONT.setBold(True)
+_VERSION_FONT = QtGui.QFont()
+_VERSION_FONT.setPointSize(9)
+_LOG_FONT = QtGui.QFont('Courier', 10)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_op(slider_val, slider_max, max_op):
+    """Formats a slider position as an op-speed string. Dragging revisits
+    the same positions constantly, so the cache makes repeats free."""
+    return f"{(slider_val / slider_max) * max_op:.3f}"
+
+
+def _repolish(widget):
+    """Re-applies the stylesheet after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class _BusWorkerSignals(QtCore.QObject):
+    """Signal carrier for BusWorker (QRunnable cannot own signals itself)."""
+    done = QtCore.Signal(object)
+    error = QtCore.Signal(str)
+
+
+class BusWorker(QtCore.QRunnable):
+    """Runs one blocking bus call on the global thread pool.
+
+    The I2C round-trips in `motor_control` / `encoder_control` block for
+    anywhere from milliseconds (single command) to seconds (HLFB capture,
+    encoder download). Running them on the GUI thread freezes paints and
+    event processing for the duration, so handlers wrap the call in a
+    BusWorker and receive the result back on the GUI thread through a
+    queued-connection signal.
+    """
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _BusWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+
+
 class Indicator(QtWidgets.QFrame):
     def __init__(self, label: str, parent=None):
         super().__init__(parent)
@@ -15,24 +104,25 @@ class Indicator(QtWidgets.QFrame):
         layout.setSpacing(4)
         self.led = QtWidgets.QLabel()
         self.led.setFixedSize(28, 28)
-        self.led.setStyleSheet("background: gray; border-radius:14px;")
+        self.led.setObjectName("led")
         self.led.setAlignment(QtCore.Qt.AlignCenter)
         self.text = QtWidgets.QLabel(label)
-        self.text.setStyleSheet("color: #e6e6e6;")
+        self.text.setObjectName("indText")
         self.text.setAlignment(QtCore.Qt.AlignCenter)
         layout.addWidget(self.led, alignment=QtCore.Qt.AlignHCenter)
         layout.addWidget(self.text)
+        self._cur = None
 
     def set_color(self, color_name: str):
-        # color_name: 'green', 'red', 'orange', 'grey'
-        mapping = {
-            'green': '#2ecc71',
-            'red': '#e74c3c',
-            'orange': '#f39c12',
-            'grey': '#7f8c8d'
-        }
-        color = mapping.get(color_name, color_name)
-        self.led.setStyleSheet(f"background: {color}; border-radius:14px;")
+        # color_name: 'green', 'red', 'orange', 'grey' (styled via the
+        # app stylesheet's QLabel#led[state=...] selectors). Handlers set
+        # the same color back-to-back (e.g. grey on every failed capture),
+        # so a no-op write skips the property flip and re-polish entirely.
+        if color_name == self._cur:
+            return
+        self._cur = color_name
+        self.led.setProperty("state", color_name)
+        _repolish(self.led)
 
 
 class DirectionOption(QtWidgets.QWidget):
@@ -43,17 +133,13 @@ class DirectionOption(QtWidgets.QWidget):
         super().__init__(parent)
         self.radio = QtWidgets.QRadioButton()
         self.symbol_label = QtWidgets.QLabel(symbol)
-        sym_font = QtGui.QFont()
-        sym_font.setPointSize(20)
-        sym_font.setBold(True)
-        self.symbol_label.setFont(sym_font)
+        self.symbol_label.setObjectName("dirSymbol")
+        self.symbol_label.setFont(_SYM_FONT)
         self.symbol_label.setAlignment(QtCore.Qt.AlignCenter)
         self.text_label = QtWidgets.QLabel(text)
-        # keep the text label default size but slightly bold for clarity
-        tfont = QtGui.QFont()
-        tfont.setPointSize(10)
-        tfont.setBold(False)
-        self.text_label.setFont(tfont)
+        self.text_label.setObjectName("dirText")
+        # keep the text label default size for clarity
+        self.text_label.setFont(_TEXT_FONT)
         self.text_label.setAlignment(QtCore.Qt.AlignCenter)
         # Let the parent widget handle mouse clicks so mousePressEvent fires on this widget
         self.symbol_label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
@@ -73,8 +159,10 @@ class DirectionOption(QtWidgets.QWidget):
         layout.addWidget(self.radio)
 
     def mousePressEvent(self, event):
-        # clicking anywhere sets the radio checked
-        self.radio.setChecked(True)
+        # clicking anywhere sets the radio checked; re-clicking the
+        # selected option would only cascade redundant toggle handling
+        if not self.radio.isChecked():
+            self.radio.setChecked(True)
         super().mousePressEvent(event)
 
     def isChecked(self) -> bool:
@@ -90,36 +178,107 @@ class DirectionOption(QtWidgets.QWidget):
 
     def set_selected(self, selected: bool):
         """Update visual appearance to indicate selected state."""
-        if selected:
-            # prominent background behind symbol
-            self.symbol_label.setStyleSheet('background: #2e86de; color: white; border-radius: 8px; padding: 4px;')
-            self.text_label.setStyleSheet('font-weight: bold; color: #ffffff;')
-        else:
-            self.symbol_label.setStyleSheet('background: transparent; color: #e6e6e6; padding: 4px;')
-            self.text_label.setStyleSheet('font-weight: normal; color: #cfcfcf;')
+        self.symbol_label.setProperty("selected", selected)
+        self.text_label.setProperty("selected", selected)
+        _repolish(self.symbol_label)
+        _repolish(self.text_label)
 
 
 class PitchMasterWindow(QtWidgets.QMainWindow):
+    MAX_HLFB_SAMPLES = 4096
+
+    # Every possible ramp-slider text, built once -- drag events index
+    # this instead of allocating a fresh str(int) per tick
+    _RAMP_STRINGS = tuple(str(i) for i in range(256))
+
     def __init__(self, dev_mode: bool = False):
         super().__init__()
         self.dev_mode = dev_mode
-        self.bus = motor_control.init_bus(dev_mode)
+        # Bus init can block on driver bring-up; it is deferred below so
+        # the window paints first and the indicator flips when ready
+        self.bus = None
 
         self.max_speed = None
-        self.angle_data = ["null"]
-        self.hlfb_data = ["null"]
-        self.encoder_data = ["null"]
+        # Empty arrays, not 'null' placeholder lists: the CSV formatter
+        # treats a zero-length array as "no data", whereas string
+        # placeholders can't be normalized to a numeric column
+        self.angle_data = np.empty(0, dtype=np.float32)
+        self.hlfb_data = np.empty(0, dtype=np.float32)
+        self.encoder_data = np.empty(0, dtype=np.float64)
         self.speed = 0
 
+        # Preallocated HLFB capture buffer. The one-byte sample count in
+        # the capture protocol tops out at 255, so this leaves generous
+        # headroom; captures slice-assign into it and hand out float32
+        # views rather than copying Python lists around.
+        self._hlfb_buf = np.empty(self.MAX_HLFB_SAMPLES, dtype=np.float32)
+        self._hlfb_len = 0
+
         self.estop_engaged = False
+        self._controls_enabled = None
+        self._last_dir_state = None
+        # First showEvent applies the initial direction visuals
+        self._pending_dir_refresh = True
 
         self._build_ui()
 
-        # Initialize indicators
-        self.ind_bus.set_color('green' if self.bus is not None else 'red')
-        self.ind_motor.set_color('grey')
-        self.ind_hlfb.set_color('grey')
-        self.ind_enc.set_color('grey')
+        # Indicator state is written here (handlers and worker callbacks
+        # just assign into the dict; dict stores are GIL-atomic) and a
+        # 10 Hz timer pushes it to the widgets, so repaint rate is
+        # decoupled from however fast events arrive. Bus shows orange
+        # until the deferred init reports back.
+        self._ind_state = {'bus': 'orange', 'motor': 'grey',
+                           'hlfb': 'grey', 'enc': 'grey'}
+        self._indicators = {'bus': self.ind_bus, 'motor': self.ind_motor,
+                            'hlfb': self.ind_hlfb, 'enc': self.ind_enc}
+        self._refresh_indicators()
+        self._ind_tick = QtCore.QTimer(self)
+        self._ind_tick.setInterval(100)
+        self._ind_tick.timeout.connect(self._refresh_indicators, QtCore.Qt.DirectConnection)
+        self._ind_tick.start()
+
+        # Kick off bus init after the event loop starts (first frame
+        # renders before any I/O), then run it off-thread
+        QtCore.QTimer.singleShot(0, self._init_bus_async)
+
+    @Slot()
+    def _refresh_indicators(self):
+        # set_color early-returns on unchanged colors, so steady state
+        # costs four dict lookups per tick and no repaints
+        for name, color in self._ind_state.items():
+            self._indicators[name].set_color(color)
+
+    @Slot()
+    def _init_bus_async(self):
+        self._run_on_bus(motor_control.init_bus, self.dev_mode,
+                         done=self._on_bus_ready, error=self._on_bus_init_error)
+
+    @Slot(object)
+    def _on_bus_ready(self, bus):
+        self.bus = bus
+        # init_bus returns the falsy NULL_BUS sentinel on failure
+        self._ind_state['bus'] = 'green' if bus else 'red'
+        if not bus:
+            self.log('Failed to initialize I2C bus')
+
+    @Slot(str)
+    def _on_bus_init_error(self, msg: str):
+        self._ind_state['bus'] = 'red'
+        self.log(f'Bus init failed: {msg}')
+
+    def _make_value_row(self, edit, slider, label):
+        """One edit+slider+range-label row. Shared by the max-speed, op-speed
+        and ramp rows so each contributes a single layout (and a single
+        participant per resize cascade) instead of a hand-built trio.
+        """
+        w = QtWidgets.QWidget()
+        h = QtWidgets.QHBoxLayout(w)
+        h.setContentsMargins(0, 0, 0, 0)
+        h.setSpacing(2)
+        h.addWidget(edit)
+        h.addWidget(slider, 1)
+        h.addWidget(label)
+        return w
 
     def _build_ui(self):
         self.setWindowTitle('PitchMaster25 Control Panel')
@@ -134,17 +293,12 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(2)
         title = QtWidgets.QLabel('Pitch Master')
-        title_font = QtGui.QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_TITLE_FONT)
         title.setAlignment(QtCore.Qt.AlignCenter)
         version = QtWidgets.QLabel('1.0.0')
-        vfont = QtGui.QFont()
-        vfont.setPointSize(9)
-        version.setFont(vfont)
+        version.setFont(_VERSION_FONT)
         version.setAlignment(QtCore.Qt.AlignCenter)
-        version.setStyleSheet('color: #9aa0a6;')
+        version.setObjectName('versionLabel')
         header_layout.addWidget(title)
         header_layout.addWidget(version)
         outer_layout.addWidget(header_widget)
@@ -160,6 +314,12 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         cfg_layout = QtWidgets.QHBoxLayout()
         cfg_group.setLayout(cfg_layout)
         self.max_speed_edit = QtWidgets.QLineEdit(); self.max_speed_edit.setFixedWidth(100)
+        # Qt-side validation rejects invalid keystrokes before Python sees
+        # them, so the handlers below never pay for exceptions on partial
+        # input like "1." or "-"
+        speed_validator = QtGui.QDoubleValidator(0.0, 1e6, 3, self)
+        speed_validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
+        self.max_speed_edit.setValidator(speed_validator)
         # Max speed slider and range label
         self.max_speed_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
         self.max_speed_slider.setMinimum(0)
@@ -168,17 +328,23 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         self.max_speed_slider.setMaximum(self._max_speed_slider_max)
         self.max_speed_slider.setValue(0)
         self.max_speed_range_label = QtWidgets.QLabel(f'(Range: 0 - {self._max_speed_slider_max} rpm)')
-        self.max_speed_range_label.setStyleSheet('color: #cfcfcf;')
-
-        # Auto-apply max speed when the user types a valid number
-        self.max_speed_edit.textChanged.connect(self.on_max_speed_changed)
-        self.max_speed_slider.valueChanged.connect(self._max_speed_slider_changed)
-        self.max_speed_edit.editingFinished.connect(self._max_speed_edit_finished)
+        self.max_speed_range_label.setObjectName('rangeLabel')
+
+        # Auto-apply max speed when the user types a valid number. The
+        # textChanged events are debounced through a single-shot timer so
+        # fast typing produces one apply pass instead of a label/slider/edit
+        # signal cascade per keystroke.
+        self._max_speed_debounce = QtCore.QTimer(self)
+        self._max_speed_debounce.setSingleShot(True)
+        self._max_speed_debounce.setInterval(100)
+        self._max_speed_debounce.timeout.connect(self._apply_max_speed, QtCore.Qt.DirectConnection)
+        self.max_speed_edit.textChanged.connect(self.on_max_speed_changed, QtCore.Qt.DirectConnection)
+        self.max_speed_slider.valueChanged.connect(self._max_speed_slider_changed, QtCore.Qt.DirectConnection)
+        self.max_speed_edit.editingFinished.connect(self._max_speed_edit_finished, QtCore.Qt.DirectConnection)
 
         cfg_layout.addWidget(QtWidgets.QLabel('Max Speed (rpm):'))
-        cfg_layout.addWidget(self.max_speed_edit)
-        cfg_layout.addWidget(self.max_speed_slider)
-        cfg_layout.addWidget(self.max_speed_range_label)
+        cfg_layout.addWidget(self._make_value_row(self.max_speed_edit, self.max_speed_slider,
+                                                  self.max_speed_range_label))
         # Removed 'Set' button — Max Speed is applied via text/slider automatically
         left_col.addWidget(cfg_group)
 
@@ -189,32 +355,30 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
 
         self.start_btn = QtWidgets.QPushButton('START')
         self.start_btn.setFixedSize(120, 60)
-        self.start_btn.setStyleSheet('background: #27ae60; color: white; font-weight: bold;')
-        self.start_btn.clicked.connect(self.on_start)
+        self.start_btn.setObjectName('startBtn')
+        self.start_btn.clicked.connect(self.on_start, QtCore.Qt.DirectConnection)
         self.start_btn.setEnabled(False)  # disabled until max speed set
 
         self.stop_btn = QtWidgets.QPushButton('STOP')
         self.stop_btn.setFixedSize(120, 60)
-        self.stop_btn.setStyleSheet('background: #34495e; color: white; font-weight: bold;')
-        self.stop_btn.clicked.connect(self.on_stop)
+        self.stop_btn.setObjectName('stopBtn')
+        self.stop_btn.clicked.connect(self.on_stop, QtCore.Qt.DirectConnection)
         self.stop_btn.setEnabled(False)  # disabled until max speed set
 
         self.estop_btn = QtWidgets.QPushButton('E-STOP')
         self.estop_btn.setFixedSize(160, 80)
-        self.estop_btn.setStyleSheet('background: #b30000; color: white; font-weight: bold; font-size: 16px;')
-        self.estop_btn.clicked.connect(self.on_engage_estop)
+        self.estop_btn.setObjectName('estopBtn')
+        self.estop_btn.clicked.connect(self.on_engage_estop, QtCore.Qt.DirectConnection)
 
         self.release_btn = QtWidgets.QPushButton('RELEASE E-STOP')
-        self.release_btn.clicked.connect(self.on_release_estop)
+        self.release_btn.clicked.connect(self.on_release_estop, QtCore.Qt.DirectConnection)
         self.release_btn.setVisible(False)  # only show when E-STOP is engaged
 
         # small controls row: parameters first, then start/stop below
         panel_layout.addWidget(QtWidgets.QLabel('Op Speed (Hz):'), 0, 0)
         # Op speed: text input + slider
-        op_widget = QtWidgets.QWidget()
-        op_h = QtWidgets.QHBoxLayout(op_widget)
-        op_h.setContentsMargins(0,0,0,0)
         self.op_speed_edit = QtWidgets.QLineEdit(); self.op_speed_edit.setFixedWidth(80)
+        self.op_speed_edit.setValidator(speed_validator)
         self.op_speed_edit.setEnabled(False)
         self.op_speed_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
         self.op_speed_slider.setEnabled(False)
@@ -224,18 +388,14 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         self.op_speed_slider.setValue(0)
         # Range label (updated when max_speed changes)
         self.op_range_label = QtWidgets.QLabel('(Range: 0 - 0.000 Hz)')
-        self.op_range_label.setStyleSheet('color: #cfcfcf;')
-        op_h.addWidget(self.op_speed_edit)
-        op_h.addWidget(self.op_speed_slider)
-        op_h.addWidget(self.op_range_label)
-        panel_layout.addWidget(op_widget, 0, 1, 1, 2)
+        self.op_range_label.setObjectName('rangeLabel')
+        panel_layout.addWidget(self._make_value_row(self.op_speed_edit, self.op_speed_slider,
+                                                    self.op_range_label), 0, 1, 1, 2)
 
         # Ramp multiplier: text + slider (with visible range label)
         panel_layout.addWidget(QtWidgets.QLabel('Ramp Mult:'), 1, 0)
-        ramp_widget = QtWidgets.QWidget()
-        ramp_h = QtWidgets.QHBoxLayout(ramp_widget)
-        ramp_h.setContentsMargins(0,0,0,0)
         self.ramp_edit = QtWidgets.QLineEdit(); self.ramp_edit.setFixedWidth(80)
+        self.ramp_edit.setValidator(QtGui.QIntValidator(0, 255, self))
         self.ramp_edit.setEnabled(False)
         self.ramp_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
         self.ramp_slider.setEnabled(False)
@@ -244,11 +404,9 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         self.ramp_slider.setValue(50)
         # Ramp range label shown next to slider (keeps symmetry with Op Speed)
         self.ramp_range_label = QtWidgets.QLabel('(Range: 0 - 255)')
-        self.ramp_range_label.setStyleSheet('color: #cfcfcf;')
-        ramp_h.addWidget(self.ramp_edit)
-        ramp_h.addWidget(self.ramp_slider)
-        ramp_h.addWidget(self.ramp_range_label)
-        panel_layout.addWidget(ramp_widget, 1, 1, 1, 2)
+        self.ramp_range_label.setObjectName('rangeLabel')
+        panel_layout.addWidget(self._make_value_row(self.ramp_edit, self.ramp_slider,
+                                                    self.ramp_range_label), 1, 1, 1, 2)
         # Initialize ramp text from slider
         self.ramp_edit.setText(str(self.ramp_slider.value()))
 
@@ -264,34 +422,22 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         self.dir_ccw.setEnabled(False)
         self.dir_group.addButton(self.dir_cw.radio)
         self.dir_group.addButton(self.dir_ccw.radio)
-        # Ensure the group enforces exclusive selection across the composite radios
-        try:
-            self.dir_group.setExclusive(True)
-        except Exception:
-            pass
+        self.dir_group.setExclusive(True)
         self.dir_cw.setChecked(True)
         dir_h.addWidget(self.dir_cw)
         dir_h.addWidget(self.dir_ccw)
         panel_layout.addWidget(dir_widget, 2, 1, 1, 2)
 
-        # Initialize direction visuals and wire toggles to update indicator
-        try:
-            # ensure exclusivity and update visuals
-            self.dir_group.setExclusive(True)
-        except Exception:
-            pass
+        # DirectionOption always exposes .radio; resolve the checked
+        # accessors once instead of hasattr-dispatching per event
+        self._cw_is_checked = self.dir_cw.radio.isChecked
+        self._ccw_is_checked = self.dir_ccw.radio.isChecked
+
         # connect toggles to update the visual indicator
-        try:
-            self.dir_cw.radio.toggled.connect(self._dir_changed)
-            self.dir_ccw.radio.toggled.connect(self._dir_changed)
-        except Exception:
-            try:
-                self.dir_cw.toggled.connect(self._dir_changed)
-                self.dir_ccw.toggled.connect(self._dir_changed)
-            except Exception:
-                pass
-        # set initial visuals
-        self._update_direction_indicator()
+        self.dir_cw.radio.toggled.connect(self._dir_changed, QtCore.Qt.DirectConnection)
+        self.dir_ccw.radio.toggled.connect(self._dir_changed, QtCore.Qt.DirectConnection)
+        # (initial visuals are applied by the first showEvent; polishing
+        # them pre-show would just be redone by show() itself)
 
         # Place Start/Stop side-by-side and allow them to expand equally
         self.start_btn.setMinimumHeight(56)
@@ -307,21 +453,15 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         panel_layout.addWidget(self.release_btn, 3, 3)
 
         # Connect sliders/edits to sync handlers
-        self.op_speed_slider.valueChanged.connect(self._op_slider_changed)
-        self.op_speed_edit.editingFinished.connect(self._op_edit_changed)
-        self.ramp_slider.valueChanged.connect(self._ramp_slider_changed)
-        self.ramp_edit.editingFinished.connect(self._ramp_edit_changed)
-        # connect the underlying radio toggled signal from the composite widgets
-        try:
-            self.dir_cw.radio.toggled.connect(self._dir_changed)
-            self.dir_ccw.radio.toggled.connect(self._dir_changed)
-        except Exception:
-            # fallback for legacy radios
-            try:
-                self.dir_cw.toggled.connect(self._dir_changed)
-                self.dir_ccw.toggled.connect(self._dir_changed)
-            except Exception:
-                pass
+        # Sync the edit when the drag ends, not on every tick -- a drag
+        # across the slider otherwise fires hundreds of valueChanged
+        # events that each reformat and rewrite the edit
+        self.op_speed_slider.sliderReleased.connect(self._op_slider_released, QtCore.Qt.DirectConnection)
+        self.op_speed_edit.editingFinished.connect(self._op_edit_changed, QtCore.Qt.DirectConnection)
+        self.ramp_slider.valueChanged.connect(self._ramp_slider_changed, QtCore.Qt.DirectConnection)
+        self.ramp_edit.editingFinished.connect(self._ramp_edit_changed, QtCore.Qt.DirectConnection)
+        # (direction toggles are already wired above -- connecting them a
+        # second time here doubled every _dir_changed invocation)
 
         left_col.addWidget(panel_group)
 
@@ -343,13 +483,20 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         enc_group = QtWidgets.QGroupBox('Encoder (Pico2)')
         enc_layout = QtWidgets.QGridLayout()
         enc_group.setLayout(enc_layout)
-        enc_layout.addWidget(QtWidgets.QPushButton('Read Position', clicked=self.on_read_position), 0, 0)
+        read_pos_btn = QtWidgets.QPushButton('Read Position')
+        read_pos_btn.clicked.connect(self.on_read_position, QtCore.Qt.DirectConnection)
+        enc_layout.addWidget(read_pos_btn, 0, 0)
         enc_layout.addWidget(QtWidgets.QLabel('Arm samples:'), 0, 1)
         self.arm_samples_edit = QtWidgets.QLineEdit('200')
+        self.arm_samples_edit.setValidator(QtGui.QIntValidator(1, 255, self))
         self.arm_samples_edit.setFixedWidth(80)
         enc_layout.addWidget(self.arm_samples_edit, 0, 2)
-        enc_layout.addWidget(QtWidgets.QPushButton('Arm', clicked=self.on_arm_encoder), 0, 3)
-        enc_layout.addWidget(QtWidgets.QPushButton('Read Encoder Data', clicked=self.on_read_encoder_data), 0, 4)
+        arm_btn = QtWidgets.QPushButton('Arm')
+        arm_btn.clicked.connect(self.on_arm_encoder, QtCore.Qt.DirectConnection)
+        enc_layout.addWidget(arm_btn, 0, 3)
+        read_enc_btn = QtWidgets.QPushButton('Read Encoder Data')
+        read_enc_btn.clicked.connect(self.on_read_encoder_data, QtCore.Qt.DirectConnection)
+        enc_layout.addWidget(read_enc_btn, 0, 4)
         left_col.addWidget(enc_group)
 
         # HLFB capture
@@ -358,16 +505,25 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         hlfb_group.setLayout(hlfb_layout)
         hlfb_layout.addWidget(QtWidgets.QLabel('Samples:'))
         self.hlfb_samples_edit = QtWidgets.QLineEdit('50'); self.hlfb_samples_edit.setFixedWidth(80)
+        self.hlfb_samples_edit.setValidator(QtGui.QIntValidator(1, 255, self))
         hlfb_layout.addWidget(self.hlfb_samples_edit)
-        hlfb_layout.addWidget(QtWidgets.QPushButton('Capture HLFB', clicked=self.on_capture_hlfb))
+        capture_btn = QtWidgets.QPushButton('Capture HLFB')
+        capture_btn.clicked.connect(self.on_capture_hlfb, QtCore.Qt.DirectConnection)
+        hlfb_layout.addWidget(capture_btn)
         left_col.addWidget(hlfb_group)
 
         # Save / Reset / Exit
         ops_layout = QtWidgets.QHBoxLayout()
         left_col.addLayout(ops_layout)
-        ops_layout.addWidget(QtWidgets.QPushButton('Save CSV', clicked=self.on_save_csv))
-        ops_layout.addWidget(QtWidgets.QPushButton('Reset', clicked=self.on_reset_all))
-        ops_layout.addWidget(QtWidgets.QPushButton('Exit', clicked=self.close))
+        save_btn = QtWidgets.QPushButton('Save CSV')
+        save_btn.clicked.connect(self.on_save_csv, QtCore.Qt.DirectConnection)
+        ops_layout.addWidget(save_btn)
+        reset_btn = QtWidgets.QPushButton('Reset')
+        reset_btn.clicked.connect(self.on_reset_all, QtCore.Qt.DirectConnection)
+        ops_layout.addWidget(reset_btn)
+        exit_btn = QtWidgets.QPushButton('Exit')
+        exit_btn.clicked.connect(self.close, QtCore.Qt.DirectConnection)
+        ops_layout.addWidget(exit_btn)
 
         # stretch
         left_col.addStretch()
@@ -381,8 +537,22 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         log_group.setLayout(log_layout)
         self.log_view = QtWidgets.QTextEdit()
         self.log_view.setReadOnly(True)
-        font = QtGui.QFont('Courier', 10)
-        self.log_view.setFont(font)
+        # Bound the retained history so long capture sessions don't grow
+        # the document (and its layout cost) without limit; Qt drops the
+        # oldest blocks in O(1). Undo stacks and line wrap both add work
+        # on every insert and neither is useful for a read-only log.
+        self.log_view.document().setMaximumBlockCount(5000)
+        self.log_view.setUndoRedoEnabled(False)
+        self.log_view.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
+        # Log batching: append() re-lays-out the document per line, which
+        # hurts during captures that log on every sample/error. log() queues
+        # lines and a short coalescing timer inserts them in one edit.
+        self._log_buf = collections.deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log, QtCore.Qt.DirectConnection)
+        self.log_view.setFont(_LOG_FONT)
         log_layout.addWidget(self.log_view)
         right_col.addWidget(log_group)
         main_layout.addLayout(right_col, 1)
@@ -392,20 +562,55 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
 
     # --- Logging helper
     def log(self, msg: str):
-        self.log_view.append(msg)
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
 
-    # --- Control handlers mapping to existing module functions
-    def on_set_max_speed(self):
+    @Slot()
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        # Suspend painting while the batch goes in so a large flush costs
+        # one repaint instead of one per inserted block
+        self.log_view.setUpdatesEnabled(False)
         try:
-            self.max_speed = float(self.max_speed_edit.text())
-            self._update_motor_controls_enabled()
-        except Exception:
-            QtWidgets.QMessageBox.critical(self, 'Invalid', 'Max speed must be a number')
+            cursor = self.log_view.textCursor()
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.insertText("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
+        finally:
+            self.log_view.setUpdatesEnabled(True)
+
+    # --- Worker dispatch helper
+    def _run_on_bus(self, fn, *args, done=None, error=None, **kwargs):
+        """Submits one blocking bus call to the global thread pool.
+
+        `done`/`error` slots are invoked back on the GUI thread (queued
+        connection), so they are free to touch widgets.
+        """
+        worker = BusWorker(fn, *args, **kwargs)
+        if done is not None:
+            worker.signals.done.connect(done, QtCore.Qt.QueuedConnection)
+        worker.signals.error.connect(error if error is not None else self._on_bus_error,
+                                     QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    @Slot(str)
+    def _on_bus_error(self, msg: str):
+        self.log(f'Bus operation failed: {msg}')
 
+    # --- Control handlers mapping to existing module functions
+    @Slot(str)
     def on_max_speed_changed(self, text: str):
+        """Coalesce textChanged bursts into one deferred apply pass."""
+        self._max_speed_debounce.start()
+
+    @Slot()
+    def _apply_max_speed(self):
         """Auto-apply max speed when the user types a valid number.
         Enables motor controls when a valid value is present, otherwise disables them.
         """
+        text = self.max_speed_edit.text()
         try:
             val = float(text) if text.strip() != '' else None
         except Exception:
@@ -429,17 +634,22 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
                 except Exception:
                     cur = 0.0
                 if cur > max_op:
-                    self.op_speed_edit.setText(f"{max_op:.3f}")
+                    # Block the paired widgets' signals while syncing them so
+                    # this apply pass doesn't re-enter itself via textChanged
+                    with QtCore.QSignalBlocker(self.op_speed_edit):
+                        self.op_speed_edit.setText(f"{max_op:.3f}")
                     # update slider accordingly
                     slider_max = self.op_speed_slider.maximum() or 1000
-                    self.op_speed_slider.setValue(int((max_op / max_op) * slider_max) if max_op>0 else 0)
+                    with QtCore.QSignalBlocker(self.op_speed_slider):
+                        self.op_speed_slider.setValue(int((max_op / max_op) * slider_max) if max_op>0 else 0)
                 # keep the max_speed_slider in sync if the typed value fits slider range
                 try:
-                    if self.max_speed <= self._max_speed_slider_max:
-                        self.max_speed_slider.setValue(int(self.max_speed))
-                    else:
-                        # if typed value exceeds slider max, push slider to max
-                        self.max_speed_slider.setValue(self._max_speed_slider_max)
+                    with QtCore.QSignalBlocker(self.max_speed_slider):
+                        if self.max_speed <= self._max_speed_slider_max:
+                            self.max_speed_slider.setValue(int(self.max_speed))
+                        else:
+                            # if typed value exceeds slider max, push slider to max
+                            self.max_speed_slider.setValue(self._max_speed_slider_max)
                 except Exception:
                     pass
             else:
@@ -447,6 +657,7 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    @Slot(int)
     def _max_speed_slider_changed(self, val: int):
         # map slider value directly to rpm and update edit box (this triggers textChanged)
         try:
@@ -454,6 +665,7 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    @Slot()
     def _max_speed_edit_finished(self):
         # Called when user finishes editing the max speed text; ensure slider reflects the value
         try:
@@ -461,30 +673,25 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         except Exception:
             return
         try:
-            if val <= self._max_speed_slider_max:
-                self.max_speed_slider.setValue(int(val))
-            else:
-                self.max_speed_slider.setValue(self._max_speed_slider_max)
+            with QtCore.QSignalBlocker(self.max_speed_slider):
+                if val <= self._max_speed_slider_max:
+                    self.max_speed_slider.setValue(int(val))
+                else:
+                    self.max_speed_slider.setValue(self._max_speed_slider_max)
         except Exception:
             pass
 
-    def _show_max_speed_status(self, val: float):
-        # Display the small status label near the Max Speed control briefly
-        try:
-            text = f"Max: {float(val):.0f} rpm"
-        except Exception:
-            text = f"Max: {val} rpm"
-        self.max_speed_status.setText(text)
-        self.max_speed_status.setVisible(True)
-        # hide after 3 seconds
-        QtCore.QTimer.singleShot(3000, lambda: self.max_speed_status.setVisible(False))
-
-
     def _update_motor_controls_enabled(self):
         """Enable/disable motor controls based on whether max_speed is set
         and whether E-Stop is engaged.
         """
         enabled = (self.max_speed is not None) and (not self.estop_engaged)
+        # This runs on every max-speed keystroke; each setEnabled below
+        # costs a change event + style polish even when the value is
+        # unchanged, so bail out if the state is already applied
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
         self.start_btn.setEnabled(enabled)
         # Allow STOP to be used if motor may be running; keep disabled if no max speed
         self.stop_btn.setEnabled(enabled)
@@ -493,20 +700,12 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
         self.ramp_edit.setEnabled(enabled)
         self.ramp_slider.setEnabled(enabled)
         # enable radio buttons for direction
-        # Direction composite widgets expose setEnabled
-        try:
-            self.dir_cw.setEnabled(enabled)
-            self.dir_ccw.setEnabled(enabled)
-        except Exception:
-            # fallback for older widget forms
-            self.dir_cw.setEnabled(enabled)
-            self.dir_ccw.setEnabled(enabled)
+        self.dir_cw.setEnabled(enabled)
+        self.dir_ccw.setEnabled(enabled)
         # refresh direction visual indicator to reflect enabled/disabled state
-        try:
-            self._update_direction_indicator()
-        except Exception:
-            pass
+        self._update_direction_indicator()
 
+    @Slot()
     def on_start(self):
         if self.estop_engaged:
             self.log('Cannot start: E-Stop is engaged')
@@ -521,7 +720,7 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
             ramp_text = self.ramp_edit.text()
             ramp = int(ramp_text) if ramp_text.strip() != '' else None
             # direction composite: check underlying radio
-            direction = 'cw' if (self.dir_cw.isChecked() if hasattr(self.dir_cw, 'isChecked') else self.dir_cw.radio.isChecked()) else 'ccw'
+            direction = 'cw' if self._cw_is_checked() else 'ccw'
 
             # Validate against max_speed so we don't exceed 100% duty
             if self.max_speed is not None and op is not None:
@@ -533,121 +732,181 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.warning(self, 'Invalid', 'Ramp multiplier must be between 0 and 255')
                 return
             self.log(f'Starting motor: op={op}, ramp={ramp}, dir={direction}')
-            res = motor_control.start_motor(self.bus, self.max_speed, operating_speed=op, ramp_multiplier=ramp, direction_string=direction)
-            if res is not None:
-                self.speed = res
-                self.log(f'Motor started at {self.speed} Hz')
-                self.ind_motor.set_color('green')
+            self._run_on_bus(motor_control.start_motor, self.bus, self.max_speed,
+                             operating_speed=op, ramp_multiplier=ramp, direction_string=direction,
+                             done=self._on_start_result, error=self._on_start_error)
         except Exception as e:
             self.log(f'Start failed: {e}')
 
+    @Slot(object)
+    def _on_start_result(self, res):
+        if res is not None:
+            self.speed = res
+            self.log(f'Motor started at {self.speed} Hz')
+            self._ind_state['motor'] = 'green'
+
+    @Slot(str)
+    def _on_start_error(self, msg: str):
+        self.log(f'Start failed: {msg}')
+
+    @Slot()
     def on_stop(self):
-        try:
-            motor_control.stop_motor(self.bus)
-            self.log('Stop command sent')
-            self.ind_motor.set_color('grey')
-        except Exception as e:
-            self.log(f'Stop failed: {e}')
+        self._run_on_bus(motor_control.stop_motor, self.bus,
+                         done=self._on_stop_result, error=self._on_stop_error)
 
+    @Slot(object)
+    def _on_stop_result(self, _res):
+        self.log('Stop command sent')
+        self._ind_state['motor'] = 'grey'
+
+    @Slot(str)
+    def _on_stop_error(self, msg: str):
+        self.log(f'Stop failed: {msg}')
+
+    @Slot()
     def on_engage_estop(self):
-        # Engage E-Stop: send stop, disable controls
-        try:
-            motor_control.emergency_stop_motor(self.bus)
-        except Exception as e:
-            self.log(f'E-Stop send failed: {e}')
+        # Engage E-Stop: send stop off-thread, disable controls immediately
+        self._run_on_bus(motor_control.emergency_stop_motor, self.bus,
+                         error=self._on_estop_send_error)
         self.estop_engaged = True
         self.estop_btn.setText('E-STOP ENGAGED')
-        self.estop_btn.setStyleSheet('background: #ff3333; color: white; font-weight: bold; font-size: 16px;')
+        self.estop_btn.setProperty('engaged', True)
+        _repolish(self.estop_btn)
         self.release_btn.setVisible(True)
         # disable motor controls when E-Stop is engaged
         self._update_motor_controls_enabled()
-        self.ind_motor.set_color('red')
+        self._ind_state['motor'] = 'red'
         self.log('E-Stop ENGAGED: motor power cut')
 
+    @Slot(str)
+    def _on_estop_send_error(self, msg: str):
+        self.log(f'E-Stop send failed: {msg}')
+
+    @Slot()
     def on_release_estop(self):
         # Simulate twist-release
         self.estop_engaged = False
         self.estop_btn.setText('E-STOP')
-        self.estop_btn.setStyleSheet('background: #b30000; color: white; font-weight: bold; font-size: 16px;')
+        self.estop_btn.setProperty('engaged', False)
+        _repolish(self.estop_btn)
         self.release_btn.setVisible(False)
         # restore motor control enabled-state depending on max_speed
         self._update_motor_controls_enabled()
-        self.ind_motor.set_color('grey')
+        self._ind_state['motor'] = 'grey'
         self.log('E-Stop released: panel re-enabled (motor remains stopped)')
 
+    @Slot()
     def on_read_position(self):
-        try:
-            val = encoder_control.read_single_sample(self.bus)
-            if val is not None:
-                self.log(f'Current Position: {val}')
-            else:
-                self.log('Failed to read position')
-        except Exception as e:
-            self.log(f'Read position error: {e}')
+        self._run_on_bus(encoder_control.read_single_sample, self.bus,
+                         done=self._on_read_position_result, error=self._on_read_position_error)
+
+    @Slot(object)
+    def _on_read_position_result(self, val):
+        if val is not None:
+            self.log(f'Current Position: {val}')
+        else:
+            self.log('Failed to read position')
 
+    @Slot(str)
+    def _on_read_position_error(self, msg: str):
+        self.log(f'Read position error: {msg}')
+
+    @Slot()
     def on_arm_encoder(self):
         try:
             if self.estop_engaged:
                 self.log('Cannot arm encoder: E-Stop is engaged')
                 return
             samples = int(self.arm_samples_edit.text())
-            ok = encoder_control.arm_encoder(self.bus, samples=samples)
-            if ok:
-                self.ind_enc.set_color('green')
-                self.log(f'Armed encoder for {samples} samples')
-            else:
-                self.log('Failed to arm encoder')
+            self._pending_arm_samples = samples
+            self._run_on_bus(encoder_control.arm_encoder, self.bus, samples=samples,
+                             done=self._on_arm_result, error=self._on_arm_error)
         except Exception as e:
             self.log(f'Arm encoder failed: {e}')
 
+    @Slot(object)
+    def _on_arm_result(self, ok):
+        if ok:
+            self._ind_state['enc'] = 'green'
+            self.log(f'Armed encoder for {self._pending_arm_samples} samples')
+        else:
+            self.log('Failed to arm encoder')
+
+    @Slot(str)
+    def _on_arm_error(self, msg: str):
+        self.log(f'Arm encoder failed: {msg}')
+
+    @Slot()
     def on_read_encoder_data(self):
-        try:
-            self.log('Attempting to read encoder data...')
-            data = encoder_control.read_encoder_data(self.bus)
-            if data:
-                self.encoder_data = data
-                self.ind_enc.set_color('green')
-                self.log(f'Retrieved {len(data)} encoder samples')
-            else:
-                self.log('No encoder data retrieved')
-        except Exception as e:
-            self.log(f'Read encoder failed: {e}')
+        self.log('Attempting to read encoder data...')
+        self._run_on_bus(encoder_control.read_encoder_data, self.bus,
+                         done=self._on_encoder_data_result, error=self._on_encoder_data_error)
+
+    @Slot(object)
+    def _on_encoder_data_result(self, data):
+        if len(data):
+            self.encoder_data = data
+            self._ind_state['enc'] = 'green'
+            self.log(f'Retrieved {len(data)} encoder samples')
+        else:
+            self.log('No encoder data retrieved')
+
+    @Slot(str)
+    def _on_encoder_data_error(self, msg: str):
+        self.log(f'Read encoder failed: {msg}')
 
+    @Slot()
     def on_capture_hlfb(self):
         try:
             samples = int(self.hlfb_samples_edit.text())
             self.log(f'Capturing HLFB ({samples} samples)')
-            self.ind_hlfb.set_color('orange')
-            data = motor_control.capture_and_read_hlfb(self.bus, num_samples=samples)
-            if data:
-                self.hlfb_data = data
-                self.angle_data = data[:]
-                self.ind_hlfb.set_color('green')
-                self.log(f'Captured {len(data)} HLFB samples')
-            else:
-                self.ind_hlfb.set_color('grey')
-                self.log('No HLFB data captured')
+            self._ind_state['hlfb'] = 'orange'
+            self._run_on_bus(motor_control.capture_and_read_hlfb, self.bus, num_samples=samples,
+                             done=self._on_hlfb_result, error=self._on_hlfb_error)
         except Exception as e:
-            self.ind_hlfb.set_color('grey')
+            self._ind_state['hlfb'] = 'grey'
             self.log(f'HLFB capture failed: {e}')
 
+    @Slot(object)
+    def _on_hlfb_result(self, data):
+        if data is not None and len(data):
+            n = min(len(data), self.MAX_HLFB_SAMPLES)
+            self._hlfb_buf[:n] = data[:n]
+            self._hlfb_len = n
+            # Views into the preallocated buffer -- no O(N) list copy
+            self.hlfb_data = self._hlfb_buf[:n]
+            self.angle_data = self._hlfb_buf[:n]
+            self._ind_state['hlfb'] = 'green'
+            self.log(f'Captured {n} HLFB samples')
+        else:
+            self._ind_state['hlfb'] = 'grey'
+            self.log('No HLFB data captured')
+
+    @Slot(str)
+    def _on_hlfb_error(self, msg: str):
+        self._ind_state['hlfb'] = 'grey'
+        self.log(f'HLFB capture failed: {msg}')
+
     # --- Slider / edit sync handlers and validation ---
+    @Slot()
+    def _op_slider_released(self):
+        self._op_slider_changed(self.op_speed_slider.value())
+
+    @Slot(int)
     def _op_slider_changed(self, val: int):
         # Slider value is mapped to a float range; use slider range 0..slider_max representing 0..max_op
         if self.max_speed is None:
             return
         max_op = self.max_speed / 60.0
         slider_max = self.op_speed_slider.maximum() or 100
-        op_val = (val / slider_max) * max_op
-        # update text without triggering editingFinished (acceptable)
-        self.op_speed_edit.setText(f"{op_val:.3f}")
+        # sync the edit without re-firing its textChanged handlers
+        with QtCore.QSignalBlocker(self.op_speed_edit):
+            self.op_speed_edit.setText(_fmt_op(val, slider_max, max_op))
 
+    @Slot()
     def _op_edit_changed(self):
-        text = self.op_speed_edit.text()
-        try:
-            val = float(text)
-        except Exception:
-            return
+        # The validator guarantees the text is empty or a valid double
+        val = float(self.op_speed_edit.text() or "0")
         if self.max_speed is None:
             return
         max_op = self.max_speed / 60.0
@@ -655,106 +914,133 @@ class PitchMasterWindow(QtWidgets.QMainWindow):
             val = 0.0
         if val > max_op:
             val = max_op
-            self.op_speed_edit.setText(f"{val:.3f}")
+            with QtCore.QSignalBlocker(self.op_speed_edit):
+                self.op_speed_edit.setText(f"{val:.3f}")
         slider_max = self.op_speed_slider.maximum() or 100
         slider_val = int((val / max_op) * slider_max) if max_op > 0 else 0
-        self.op_speed_slider.setValue(slider_val)
+        with QtCore.QSignalBlocker(self.op_speed_slider):
+            self.op_speed_slider.setValue(slider_val)
 
+    @Slot(int)
     def _ramp_slider_changed(self, val: int):
-        self.ramp_edit.setText(str(val))
+        with QtCore.QSignalBlocker(self.ramp_edit):
+            self.ramp_edit.setText(self._RAMP_STRINGS[val])
 
+    @Slot()
     def _ramp_edit_changed(self):
-        text = self.ramp_edit.text()
-        try:
-            val = int(text)
-        except Exception:
-            return
+        # The validator guarantees the text is empty or an int
+        val = int(self.ramp_edit.text() or "0")
         if val < 0:
             val = 0
         if val > 255:
             val = 255
-            self.ramp_edit.setText(str(val))
-        self.ramp_slider.setValue(val)
+            with QtCore.QSignalBlocker(self.ramp_edit):
+                self.ramp_edit.setText(str(val))
+        with QtCore.QSignalBlocker(self.ramp_slider):
+            self.ramp_slider.setValue(val)
 
+    @Slot(bool)
     def _dir_changed(self, checked: bool):
         # Update visuals for direction options whenever selection changes
-        try:
+        self._update_direction_indicator()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_dir_refresh:
+            self._pending_dir_refresh = False
             self._update_direction_indicator()
-        except Exception:
-            pass
 
     def _update_direction_indicator(self):
-        # Set visual selection for composite direction widgets
-        try:
-            cw_selected = False
-            ccw_selected = False
-            if hasattr(self.dir_cw, 'radio'):
-                cw_selected = self.dir_cw.radio.isChecked()
-            elif hasattr(self.dir_cw, 'isChecked'):
-                cw_selected = self.dir_cw.isChecked()
-            if hasattr(self.dir_ccw, 'radio'):
-                ccw_selected = self.dir_ccw.radio.isChecked()
-            elif hasattr(self.dir_ccw, 'isChecked'):
-                ccw_selected = self.dir_ccw.isChecked()
+        # Hidden widgets don't need their styles polished; note that a
+        # refresh is owed and apply it on the next showEvent instead
+        if not self.isVisible():
+            self._pending_dir_refresh = True
+            return
+        cw_selected = self._cw_is_checked()
+        ccw_selected = self._ccw_is_checked()
 
-            try:
-                self.dir_cw.set_selected(cw_selected)
-                self.dir_ccw.set_selected(ccw_selected)
-            except Exception:
-                # if composite doesn't support set_selected, ignore
-                pass
-        except Exception:
-            pass
+        # skip the style polishes when nothing actually changed
+        if (cw_selected, ccw_selected) == self._last_dir_state:
+            return
+        self._last_dir_state = (cw_selected, ccw_selected)
 
+        self.dir_cw.set_selected(cw_selected)
+        self.dir_ccw.set_selected(ccw_selected)
+
+    @Slot()
     def on_save_csv(self):
-        try:
-            # Ask user for filename & location using QFileDialog.getSaveFileName
-            dlg = QtWidgets.QFileDialog(self)
-            dlg.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
-            dlg.setNameFilter('CSV Files (*.csv)')
-            dlg.setDefaultSuffix('csv')
-            path, _ = dlg.getSaveFileName(self, 'Save CSV', '', 'CSV Files (*.csv)')
-            if path and path.strip() != '':
-                save_data_to_csv.save(self.speed, self.angle_data, self.hlfb_data, self.encoder_data, file_path=path)
-                self.log(f'Saved CSV to {path}')
-            else:
-                self.log('Save cancelled')
-        except Exception as e:
-            self.log(f'Save failed: {e}')
+        # Ask user for filename & location using QFileDialog.getSaveFileName.
+        # Write errors surface through the worker's error signal, so no
+        # broad catch is needed here.
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, 'Save CSV', '',
+                                                        'CSV Files (*.csv)')
+        # getSaveFileName returns '' on cancel, so a plain truthiness
+        # check is sufficient
+        if path:
+            # Writing thousands of rows can take long enough to stall
+            # paints, so the save runs on the same worker pool as the
+            # bus calls
+            self._pending_save_path = path
+            self._run_on_bus(save_data_to_csv.save, self.speed, self.angle_data,
+                             self.hlfb_data, self.encoder_data, file_path=path,
+                             done=self._on_save_done, error=self._on_save_error)
+        else:
+            self.log('Save cancelled')
 
-    def on_reset_all(self):
-        # Reset inputs and in-memory data but do NOT release a latched E-Stop
-        try:
-            self.max_speed = None
-            self.max_speed_edit.setText('')
-            self.op_speed_edit.setText('')
+    @Slot(object)
+    def _on_save_done(self, _res):
+        self.log(f'Saved CSV to {self._pending_save_path}')
+
+    @Slot(str)
+    def _on_save_error(self, msg: str):
+        self.log(f'Save failed: {msg}')
+
+    def _reset_speed_inputs(self):
+        self.max_speed = None
+        self.max_speed_edit.setText('')
+        self.op_speed_edit.setText('')
+        # Programmatic resets shouldn't re-enter the sync handlers
+        with QtCore.QSignalBlocker(self.op_speed_slider):
             self.op_speed_slider.setValue(0)
+        with QtCore.QSignalBlocker(self.ramp_edit):
             self.ramp_edit.setText(str(self.ramp_slider.value()))
-            self.ramp_slider.setValue(self.ramp_slider.value())
-            # set direction to default CW (works for composite DirectionOption)
+
+    def _reset_dir(self):
+        # set direction to default CW
+        self.dir_cw.setChecked(True)
+
+    def _reset_samples(self):
+        self.arm_samples_edit.setText('200')
+        self.hlfb_samples_edit.setText('50')
+
+    def _reset_data(self):
+        self.angle_data = np.empty(0, dtype=np.float32)
+        self.hlfb_data = np.empty(0, dtype=np.float32)
+        self.encoder_data = np.empty(0, dtype=np.float64)
+        self._hlfb_len = 0
+        self.speed = 0
+        self.log_view.clear()
+
+    @Slot()
+    def on_reset_all(self):
+        # Reset inputs and in-memory data but do NOT release a latched
+        # E-Stop. Each stage is guarded separately so one failing widget
+        # write can't silently skip the rest of the reset, and only the
+        # errors a widget call can actually raise are caught.
+        for step in (self._reset_speed_inputs, self._reset_dir,
+                     self._reset_samples, self._reset_data):
             try:
-                self.dir_cw.setChecked(True)
-            except Exception:
-                try:
-                    self.dir_cw.radio.setChecked(True)
-                except Exception:
-                    pass
-            self.arm_samples_edit.setText('200')
-            self.hlfb_samples_edit.setText('50')
-            self.angle_data = ['null']
-            self.hlfb_data = ['null']
-            self.encoder_data = ['null']
-            self.speed = 0
-            self.log_view.clear()
-            self.log('State reset to defaults')
-            # Update controls according to cleared max_speed / e-stop state
-            self._update_motor_controls_enabled()
-        except Exception as e:
-            self.log(f'Reset failed: {e}')
+                step()
+            except (AttributeError, RuntimeError) as e:
+                self.log(f'Reset step {step.__name__} failed: {e}')
+        self.log('State reset to defaults')
+        # Update controls according to cleared max_speed / e-stop state
+        self._update_motor_controls_enabled()
 
 
 def run_gui(dev_mode: bool = False):
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    app.setStyleSheet(_APP_STYLESHEET)
     win = PitchMasterWindow(dev_mode=dev_mode)
     win.show()
     app.exec()
@@ -1,16 +1,18 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import readline
+import signal
+import statistics
+import threading
+import numpy as np
 import motor_control
 import save_data_to_csv
+import sinusoidal_curve_fit
 import encoder_control  # <--- NEW IMPORT
 import time
 import gui
-
-# Development mode toggle: when True, use MockFactory for gpiozero pins and
-# enable the Dummy I2C bus emulation in `motor_control` by passing DEV_MODE
-# into `init_bus`.
-DEV_MODE = False
-
-# GUI vs Terminal toggle: set to True to launch the PySide6 GUI instead of CLI
-GUI_MODE = False
+from config import DEV_MODE, GUI_MODE, E_STOP_PIN, E_STOP_SOURCE
 
 # GPIO setup: use MockFactory when DEV_MODE is True; otherwise try to import
 # the native gpiozero devices. Fall back to MockFactory only if native import
@@ -42,33 +44,102 @@ else:
 
 # (DEV_MODE can be changed above; do not override it here.)
 
-# --- E-STOP CONFIGURATION ---
-E_STOP_PIN = 23
-E_STOP_SOURCE = 24
+# --------------------- CLI PROMPT ----------------------
+# Built once at import; the input loop just passes the same string object.
+_CMDS = ("help", "config", "start", "stop", "e", "pos", "arm",
+         "read_enc", "hlfb", "save", "fit", "stats", "exit")
+_PROMPT = "\nType command (start, stop, e, arm, read_enc, hlfb, save, exit): "
+
+# Per-command wall-time samples in nanoseconds, bounded so a long session
+# cannot grow memory. Dumped by the 'stats' command to show where time
+# actually goes before anyone tunes anything.
+_TIMES = {cmd: deque(maxlen=1000) for cmd in _CMDS}
+
+
+def _command_completer(text, state):
+    """readline completer over the fixed command set."""
+    matches = [c for c in _CMDS if c.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def _read_command(loop, prompt):
+    """
+    Runs input() on a dedicated daemon thread and returns a future for
+    the line. Not asyncio.to_thread: when SIGINT abandons a prompt
+    mid-read, a default-executor worker parked in input() would stall
+    asyncio's shutdown join, while a daemon thread just dies with the
+    process.
+    """
+    fut = loop.create_future()
+
+    def _reader():
+        try:
+            line = input(prompt)
+        except EOFError:
+            line = "exit"
+
+        def _deliver():
+            if not fut.done():  # dropped if SIGINT already cancelled it
+                fut.set_result(line)
+
+        loop.call_soon_threadsafe(_deliver)
+
+    threading.Thread(target=_reader, daemon=True, name="cli-prompt").start()
+    return fut
+
+
+# --- E-STOP STATE ---
 E_STOP_ACTIVATED = False
 e_stop_button = None
-bus = None
+# NULL_BUS safely swallows commands until init_bus() swaps in the real bus,
+# so the E-Stop path never needs an is-it-ready check
+bus = motor_control.NULL_BUS
+event_loop = None
+
+# --------------------- CLI STATE ----------------------
+@dataclass
+class CLIState:
+    """Mutable session state threaded through the CLI command handlers."""
+    max_speed: float = 0.0
+    speed: float = 0
+    angle_data: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    hlfb_data: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    encoder_data: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    running: bool = True
+
+    def reset_data(self):
+        self.angle_data = np.empty(0, dtype=np.float32)
+        self.hlfb_data = np.empty(0, dtype=np.float32)
+        self.encoder_data = np.empty(0, dtype=np.float64)
+        self.speed = 0
 
 # --------------------- E-STOP HANDLER ----------------------
 def emergency_stop_handler():
-    global bus
+    # gpiozero invokes this from its own callback thread. Scheduling the
+    # stop onto the asyncio loop lets it run even while a command (HLFB
+    # read, encoder download) is blocking in the executor.
     global E_STOP_ACTIVATED
-    
-    if bus is not None:
-        print("\n\n*** HARDWARE E-STOP DETECTED! Executing emergency stop. ***")
-        E_STOP_ACTIVATED = True
-        motor_control.emergency_stop_motor(bus)
-        print("Motor stopped.")
+
+    # No bus-readiness check: before init_bus() completes, `bus` is the
+    # NULL_BUS sentinel and the stop command is a harmless no-op.
+    print("\n\n*** HARDWARE E-STOP DETECTED! Executing emergency stop. ***")
+    E_STOP_ACTIVATED = True
+    if event_loop is not None and event_loop.is_running():
+        asyncio.run_coroutine_threadsafe(
+            asyncio.to_thread(motor_control.emergency_stop_motor, bus), event_loop)
     else:
-        print("\n\n*** HARDWARE E-STOP DETECTED, but communication with PICO1 is not initialized! ***")
+        motor_control.emergency_stop_motor(bus)
+    print("Motor stopped.")
 
 # --------------------- ENTRY POINT ----------------------
-def main():
+async def main():
     print("Starting PitchMaster25 Motor Control Interface")
     global bus
     global E_STOP_ACTIVATED
     global e_stop_button
-    
+    global event_loop
+    event_loop = asyncio.get_running_loop()
+
     try:
         e_stop_button = Button(E_STOP_PIN, bounce_time=0.2)
         e_stop_button.when_pressed = emergency_stop_handler
@@ -79,26 +150,46 @@ def main():
         e_stop_button = None
 
     # Initialize the I2C bus (pass DEV_MODE to enable emulation)
-    bus = motor_control.init_bus(DEV_MODE)
-    if bus is None:
-        print("Failed to initialize I2C bus. Exiting.") 
+    bus = await asyncio.to_thread(motor_control.init_bus, DEV_MODE)
+    if not bus:
+        print("Failed to initialize I2C bus. Exiting.")
         return
     
-    # Data storage
-    angle_data = ["null"]
-    hlfb_data = ["null"]
-    encoder_data = ["null"] # <--- Storage for Pico 2 data
-    speed = 0
+    state = CLIState()
+
+    # One-time readline setup so command names tab-complete at the prompt
+    readline.set_completer(_command_completer)
+    readline.parse_and_bind("tab: complete")
+
+    # Ctrl+C must stop the motor: a raw KeyboardInterrupt would cancel
+    # the main task at the prompt await without ever reaching a handler
+    # inside it, so SIGINT is hooked on the loop instead. The handler
+    # stops the motor immediately, ends the session, and cancels the
+    # pending prompt read so shutdown does not wait on stdin.
+    prompt_fut = None
+
+    def _on_sigint():
+        print("\n\nProgram interrupted by user. Stopping motor...")
+        state.running = False
+        motor_control.stop_motor(bus)
+        if prompt_fut is not None and not prompt_fut.done():
+            prompt_fut.cancel()
 
     try:
-        max_speed = motor_control.configure_motor()
-        
-        while True:
-            command = input("\nType command (start, stop, e, arm, read_enc, hlfb, save, exit): ")
-            
-            match command:
-                case "help":
-                    print('''Commands: 
+        event_loop.add_signal_handler(signal.SIGINT, _on_sigint)
+    except NotImplementedError:
+        # Non-Unix loop: KeyboardInterrupt still lands in the fallback
+        # handler around the command loop below
+        pass
+
+    try:
+        state.max_speed = await asyncio.to_thread(motor_control.configure_motor)
+
+        # --- Command handlers, built once. Dispatch is a dict lookup
+        # instead of re-walking a match ladder every iteration, and each
+        # handler is reusable from harnesses without the loop around it.
+        async def cmd_help(state):
+            print('''Commands: 
     start    = Start motor
     stop     = Stop motor
     e        = Emergency Brake
@@ -107,81 +198,130 @@ def main():
     read_enc = Downloads recorded encoder data from Pico 2
     hlfb     = Capture HLFB from motor and encoder data
     save     = Save datasets to CSV
-    fit      = Fit the encoder data to a sinusoidal curse profile 
+    fit      = Fit the encoder data to a sinusoidal curse profile
+    stats    = Show per-command timing stats for this session
     exit     = Exit program''')
 
-                case "config":
-                    max_speed = motor_control.configure_motor()
-                    angle_data = ["null"]
-                    hlfb_data = ["null"]
-                    encoder_data = ["null"]
-                    speed = 0
-
-                case "start":
-                    speed = motor_control.start_motor(bus, max_speed)
-
-                case "stop":
-                    motor_control.stop_motor(bus)
-
-                case "e":
-                    motor_control.emergency_stop_motor(bus)
-                    
-                case "pos":
-                    # Grab one sample immediately
-                    val = encoder_control.read_single_sample(bus)
-                    if val is not None:
-                        print(f"Current Position: {val}")
-                    else:
-                        print("Failed to read position.")
-                    
-                case "arm":
-                    encoder_control.arm_encoder(bus)
-
-                case "read_enc":
-                    print("Attempting to read data from Pico 2...")
-                    # Calling the separate file
-                    data = encoder_control.read_encoder_data(bus)
-                    
-                    if data:
-                        encoder_data = data 
-                        print(f"Retrieved {len(encoder_data)} samples.")
-                        print(f"First 5 samples: {encoder_data[:5]}")
-                    else:
-                        print("No data retrieved.")
-
-                case "hlfb":
-                    hlfb_data = motor_control.capture_and_read_hlfb(bus)
-                    angle_data = hlfb_data[:] 
-                    print(f"\nSuccessfully captured {len(hlfb_data)} data points.")
-
-                case "save":
-                    print("Saving to CSV...")
-                    # Ensure your save_data_to_csv.save function accepts the 4th argument!
-                    save_data_to_csv.save(speed, angle_data, hlfb_data, encoder_data)
-                    
-                case "fit":
-                    print("Applying a sinusoidal curve fit to the encoder data...")
-                    if encoder_data:
-                        print("Data found:")
-                        encoder_data_length = len(encoder_data)
-                        encoder_time = []
-                        dt = 1/484
-                        for i in range(encoder_data_length):
-                            encoder_time.append(dt * i)
-                        sinusoidal_curve_fit.fit_sinusoidal_to_data(encoder_time, encoder_data, show_plot=True)
-                    else:
-                        print("Run the 'read_enc' command to collect the data from the encoder.")
-                
-
-                case "exit":
-                    print("Stopping motor before exit...")
-                    motor_control.stop_motor(bus)
-                    break
-
-                case _:
-                    print("Unknown command. Type 'help'.")
+        async def cmd_config(state):
+            state.max_speed = await asyncio.to_thread(motor_control.configure_motor)
+            state.reset_data()
+
+        async def cmd_start(state):
+            state.speed = await asyncio.to_thread(motor_control.start_motor, bus, state.max_speed)
+
+        async def cmd_stop(state):
+            await asyncio.to_thread(motor_control.stop_motor, bus)
+
+        async def cmd_estop(state):
+            await asyncio.to_thread(motor_control.emergency_stop_motor, bus)
+
+        async def cmd_pos(state):
+            # Grab one sample immediately
+            val = await asyncio.to_thread(encoder_control.read_single_sample, bus)
+            if val is not None:
+                print(f"Current Position: {val}")
+            else:
+                print("Failed to read position.")
+
+        async def cmd_arm(state):
+            samples_text = await asyncio.to_thread(
+                input, "Enter number of samples to record (default 200): ") or "200"
+            try:
+                await asyncio.to_thread(encoder_control.arm_encoder, bus, samples=int(samples_text))
+            except ValueError:
+                print("Value is not a valid number. Please try again.")
+
+        async def cmd_read_enc(state):
+            print("Attempting to read data from Pico 2...")
+            # Calling the separate file
+            data = await asyncio.to_thread(encoder_control.read_encoder_data, bus)
+            if len(data):
+                state.encoder_data = data
+                print(f"Retrieved {len(state.encoder_data)} samples.")
+                print(f"First 5 samples: {state.encoder_data[:5]}")
+            else:
+                print("No data retrieved.")
+
+        async def cmd_hlfb(state):
+            data = await asyncio.to_thread(motor_control.capture_and_read_hlfb, bus)
+            if data is not None and len(data):
+                # Copy out of the module's reusable capture buffer: the
+                # returned array is a view that the next capture overwrites
+                # in place, which would corrupt data held across commands
+                state.hlfb_data = data.copy()
+                # Plain aliasing of the copy: nothing downstream mutates
+                # either array, so one duplicate is enough
+                state.angle_data = state.hlfb_data
+                print(f"\nSuccessfully captured {len(state.hlfb_data)} data points.")
+            else:
+                print("No HLFB data captured.")
+
+        async def cmd_save(state):
+            print("Saving to CSV...")
+            await asyncio.to_thread(save_data_to_csv.save, state.speed, state.angle_data,
+                                    state.hlfb_data, state.encoder_data)
+
+        async def cmd_fit(state):
+            print("Applying a sinusoidal curve fit to the encoder data...")
+            if len(state.encoder_data):
+                print("Data found:")
+                dt = 1/484
+                encoder_time = [dt * i for i in range(len(state.encoder_data))]
+                sinusoidal_curve_fit.fit_sinusoidal_to_data(encoder_time, state.encoder_data, show_plot=True)
+            else:
+                print("Run the 'read_enc' command to collect the data from the encoder.")
+
+        async def cmd_stats(state):
+            print("\n--- Command timings (ms) ---")
+            for cmd in _CMDS:
+                samples = _TIMES[cmd]
+                if not samples:
+                    continue
+                vals = sorted(samples)
+                p99 = statistics.quantiles(vals, n=100)[98] if len(vals) >= 2 else vals[-1]
+                print(f"{cmd:>8}: n={len(vals):4d}  min={vals[0] / 1e6:9.3f}  "
+                      f"median={statistics.median(vals) / 1e6:9.3f}  p99={p99 / 1e6:9.3f}")
+            print("----------------------------")
+
+        async def cmd_exit(state):
+            print("Stopping motor before exit...")
+            await asyncio.to_thread(motor_control.stop_motor, bus)
+            state.running = False
+
+        async def cmd_unknown(state):
+            print("Unknown command. Type 'help'.")
+
+        handlers = {
+            "help": cmd_help,
+            "config": cmd_config,
+            "start": cmd_start,
+            "stop": cmd_stop,
+            "e": cmd_estop,
+            "pos": cmd_pos,
+            "arm": cmd_arm,
+            "read_enc": cmd_read_enc,
+            "hlfb": cmd_hlfb,
+            "save": cmd_save,
+            "fit": cmd_fit,
+            "stats": cmd_stats,
+            "exit": cmd_exit,
+        }
+
+        while state.running:
+            # Read the prompt on its own thread so the loop stays free to
+            # service tasks scheduled from the E-Stop callback thread
+            prompt_fut = _read_command(event_loop, _PROMPT)
+            try:
+                command = await prompt_fut
+            except asyncio.CancelledError:
+                break  # SIGINT handler cancelled the prompt
+            t0 = time.perf_counter_ns()
+            await handlers.get(command, cmd_unknown)(state)
+            if command in _TIMES:
+                _TIMES[command].append(time.perf_counter_ns() - t0)
 
     except KeyboardInterrupt:
+        # Fallback for event loops without add_signal_handler support
         print("\nProgram interrupted by user.")
         motor_control.stop_motor(bus)
     except Exception as e:
@@ -193,4 +333,4 @@ if __name__ == "__main__":
     if GUI_MODE:
         gui.run_gui(DEV_MODE)
     else:
-        main()
+        asyncio.run(main())
@@ -1,9 +1,32 @@
+import csv
+import functools
+import queue
 import struct
+import threading
 import time
-from smbus2 import SMBus
+import numpy as np
+from collections import namedtuple
+from smbus2 import SMBus, i2c_msg
+
+# Public API; keeps internal Struct/buffer caches out of star-imports
+__all__ = [
+    "DummyBus", "NullBus", "NULL_BUS",
+    "init_bus", "close_bus",
+    "configure_motor", "make_start_cmd_builder", "start_motor", "stop_motor",
+    "emergency_stop_motor",
+    "capture_and_read_hlfb", "stream_hlfb_to_csv",
+    "print_pico_status",
+]
 
 
 # --- Dummy I2C Bus for dev-mode (emulation) -----------------
+
+# Whole-bus emulator state, replaced atomically on every write so that
+# concurrent readers (GUI worker + indicator polling) always see a
+# consistent snapshot without a lock
+_BusState = namedtuple("_BusState", "last_write_50 last_write_60 memory_60")
+
+
 class DummyBus:
     """A simple I2C bus emulator that responds to the project's basic commands.
 
@@ -12,111 +35,186 @@ class DummyBus:
     physical hardware.
     """
     def __init__(self):
-        self._last_write = {}
-        # Memory per address for emulated devices
-        self._memory = {}
-        # Prepare some default encoder data for pico2 (address 0x60)
-        self._encoder_samples = [i * 10 for i in range(200)]
+        # Immutable snapshot of (last writes, encoder memory); reads take
+        # one attribute load, writes swap in a new tuple
+        self._state = _BusState(None, None, b'')
+        # Default encoder waveform for pico2 (address 0x60), prepacked once
+        # as little-endian int32 bytes; CMD_RECORD slices (or repeats) this
+        # instead of struct-packing per sample on every arm
+        self._encoder_bytes_full = (np.arange(200, dtype='<i4') * 10).tobytes()
+        # Dispatch table for read_i2c_block_data, keyed by
+        # (device address, last command byte)
+        self._read_handlers = {
+            (0x50, 1): self._read_motor_running,    # CMD_START_SEQUENCE
+            (0x50, 3): self._read_hlfb_recorded,    # CMD_RECORD_HLFB
+            (0x50, 4): self._read_hlfb_chunk,       # CMD_READ_HLFB_CHUNK
+            (0x50, 5): self._read_motor_stopped,    # CMD_EMERGENCY_STOP
+            (0x60, 0x21): self._read_record_ready,  # CMD_RECORD
+            (0x60, 0x22): self._read_encoder_chunk, # CMD_READ_CHUNK
+            (0x60, 0x23): self._read_single_shot,   # CMD_SINGLE_SHOT
+        }
+        # Static status responses, pre-sliced per read length so the idle
+        # path (most reads) hands back a cached list instead of building
+        # a fresh one per call
+        idle_50 = (0x12, 0, 0, 0, 0, 0)  # STATUS_MOTOR_STOPPED
+        idle_60 = (0x31, 0, 0, 0, 0, 0)  # encoder idle
+        self._idle_50 = {n: list(idle_50[:n]) for n in range(1, 7)}
+        self._idle_60 = {n: list(idle_60[:n]) for n in range(1, 7)}
 
     def write_i2c_block_data(self, addr, register, data):
-        # store last write for the address so read logic can inspect it
-        self._last_write[addr] = (register, bytes(data) if isinstance(data, (bytes, bytearray)) else bytes(data))
+        payload = bytes(data) if isinstance(data, (bytes, bytearray)) else bytes(data)
+        st = self._state
 
-        # If writing to Pico2 (encoder) with CMD_RECORD, populate memory
         if addr == 0x60:
-            if len(data) >= 2 and data[0] == 0x21:  # CMD_RECORD
-                samples = data[1] or 200
-                # prepare bytes (signed ints) for samples
-                b = bytearray()
-                for i in range(samples):
-                    val = self._encoder_samples[i % len(self._encoder_samples)]
-                    b.extend(struct.pack('<i', val))
-                self._memory[addr] = bytes(b)
+            # If writing to Pico2 (encoder) with CMD_RECORD, populate memory
+            memory = st.memory_60
+            if len(payload) >= 2 and payload[0] == 0x21:  # CMD_RECORD
+                samples = payload[1] or 200
+                need = samples * 4
+                if need <= len(self._encoder_bytes_full):
+                    memory = self._encoder_bytes_full[:need]
+                else:
+                    reps = -(-need // len(self._encoder_bytes_full))
+                    memory = (self._encoder_bytes_full * reps)[:need]
+            self._state = st._replace(last_write_60=(register, payload), memory_60=memory)
+        elif addr == 0x50:
+            self._state = st._replace(last_write_50=(register, payload))
+        # writes to unknown addresses are ignored, matching the zeros the
+        # read path returns for them
 
         return None
 
+    def write_byte_data(self, addr, register, value):
+        # Single-byte command (e.g. the encoder's CMD_SINGLE_SHOT):
+        # record it like a one-byte block write so the matching read
+        # handler fires on the next read
+        return self.write_i2c_block_data(addr, register, [value])
+
+    # --- Read handlers, one per (address, last command) pair -----
+    def _read_hlfb_recorded(self, st, data, length):
+        # Last command was record HLFB: report that capture is done
+        num = data[1] if len(data) > 1 else 10
+        total_bytes = num * 4
+        # STATUS_HLFB_RECORDED
+        return [0x13, num, total_bytes & 0xFF, (total_bytes >> 8) & 0xFF, 0, 0][:length]
+
+    def _read_hlfb_chunk(self, st, data, length):
+        # data[1:3] contain offset
+        # Return STATUS_HLFB_DATA_CHUNK + 4-byte little-endian float
+        # Generate a simple waveform value based on offset
+        offset = data[1] | (data[2] << 8)
+        value = float(offset) / 4.0
+        b = bytearray(6)
+        b[0] = 0x15  # STATUS_HLFB_DATA_CHUNK
+        _F32.pack_into(b, 1, value)
+        return list(b)[:length]
+
+    def _read_motor_stopped(self, st, data, length):
+        return self._idle_50.get(length) or [0x12, 0, 0, 0, 0, 0][:length]
+
+    def _read_motor_running(self, st, data, length):
+        # pretend motor is running, return a speed value
+        speed = 1234
+        return [0x11, (speed >> 8) & 0xFF, speed & 0xFF, 0, 0, 0][:length]
+
+    def _read_single_shot(self, st, data, length):
+        # return STATUS_SINGLE_SHOT_READY + 4-byte unsigned int
+        val = 123456
+        b = bytearray(5)
+        b[0] = 0x35  # STATUS_SINGLE_SHOT_READY
+        _U32.pack_into(b, 1, val)
+        return list(b)[:length]
+
+    def _read_record_ready(self, st, data, length):
+        mem = st.memory_60
+        total_bytes = len(mem)
+        # STATUS_READY with total_bytes in bytes 1-2
+        return [0x33, total_bytes & 0xFF, (total_bytes >> 8) & 0xFF, 0, 0, 0][:length]
+
+    def _read_encoder_chunk(self, st, data, length):
+        if len(data) >= 3:
+            offset = data[1] | (data[2] << 8)
+            mem = st.memory_60
+            # Bulk chunk response: [STATUS_CHUNK, payload_len, data...]
+            # with up to 28 data bytes per 32-byte SMBus block
+            chunk = mem[offset:offset + 28]
+            b = bytearray(2 + len(chunk))
+            b[0] = 0x34  # STATUS_CHUNK
+            b[1] = len(chunk)
+            b[2:] = chunk
+            return list(b.ljust(length, b'\x00'))[:length]
+        return self._idle_60.get(length) or [0x31, 0, 0, 0, 0, 0][:length]
+
     def read_i2c_block_data(self, addr, register, length):
-        # Inspect last write to decide what to return
-        last = self._last_write.get(addr)
+        # One snapshot load, then table-driven dispatch on (address, last
+        # command byte) — no locks and no shared-dict reads mid-update
+        st = self._state
+        if addr == 0x50:
+            last = st.last_write_50
+        elif addr == 0x60:
+            last = st.last_write_60
+        else:
+            return [0] * length
+
+        if last and last[1]:
+            handler = self._read_handlers.get((addr, last[1][0]))
+            if handler:
+                return handler(st, last[1], length)
 
-        # Emulated Pico (HLFB) at 0x50
+        # Default statuses (idle)
         if addr == 0x50:
-            if last:
-                reg, data = last
-                cmd = data[0]
-                # If the last command was record HLFB, report that capture is done
-                if cmd == 3:  # CMD_RECORD_HLFB
-                    num = data[1] if len(data) > 1 else 10
-                    total_bytes = num * 4
-                    # STATUS_HLFB_RECORDED
-                    return [0x13, num, total_bytes & 0xFF, (total_bytes >> 8) & 0xFF, 0, 0][:length]
-                elif cmd == 4:  # CMD_READ_HLFB_CHUNK
-                    # data[1:3] contain offset
-                    # Return STATUS_HLFB_DATA_CHUNK + 4-byte little-endian float
-                    # Generate a simple waveform value based on offset
-                    offset = data[1] | (data[2] << 8)
-                    value = float(offset) / 4.0
-                    b = bytearray(6)
-                    b[0] = 0x15  # STATUS_HLFB_DATA_CHUNK
-                    struct.pack_into('<f', b, 1, value)
-                    return list(b)[:length]
-                elif cmd == 5:  # CMD_EMERGENCY_STOP
-                    return [0x12, 0, 0, 0, 0, 0][:length]  # STATUS_MOTOR_STOPPED
-                elif cmd == 1:  # CMD_START_SEQUENCE
-                    # pretend motor is running, return a speed value
-                    speed = 1234
-                    return [0x11, (speed >> 8) & 0xFF, speed & 0xFF, 0, 0, 0][:length]
-
-            # Default status (idle)
-            return [0x12, 0, 0, 0, 0, 0][:length]
-
-        # Emulated Pico2 (encoder) at 0x60
-        if addr == 0x60:
-            if last:
-                reg, data = last
-                cmd = data[0]
-                if cmd == 0x23:  # CMD_SINGLE_SHOT
-                    # return STATUS_SINGLE_SHOT_READY + 4-byte unsigned int
-                    val = 123456
-                    b = bytearray(5)
-                    b[0] = 0x35  # STATUS_SINGLE_SHOT_READY
-                    struct.pack_into('<I', b, 1, val)
-                    return list(b)[:length]
-                elif cmd == 0x21:  # CMD_RECORD
-                    mem = self._memory.get(addr, b'')
-                    total_bytes = len(mem)
-                    # STATUS_READY with total_bytes in bytes 1-2
-                    return [0x33, total_bytes & 0xFF, (total_bytes >> 8) & 0xFF, 0, 0, 0][:length]
-
-            # If a read chunk was requested, return STATUS_CHUNK + 4 bytes from memory
-            # We attempt to locate the last register used to request the chunk
-            # Some calls use write_i2c_block_data with register==CMD_READ_CHUNK and payload [lsb, msb]
-            # Try to find a chunk request in last_write
-            if last and isinstance(last[1], (bytes, bytearray)):
-                payload = last[1]
-                if len(payload) >= 3 and payload[0] == 0x22:  # CMD_READ_CHUNK
-                    lsb = payload[1]
-                    msb = payload[2]
-                    offset = lsb | (msb << 8)
-                    mem = self._memory.get(addr, b'')
-                    chunk = mem[offset:offset+4]
-                    if len(chunk) < 4:
-                        chunk = chunk.ljust(4, b'\x00')
-                    b = bytearray(6)
-                    b[0] = 0x34  # STATUS_CHUNK
-                    b[1:5] = chunk
-                    return list(b)[:length]
-
-            return [0x31, 0, 0, 0, 0, 0][:length]
-
-        # Default: return zeros
-        return [0] * length
+            return self._idle_50.get(length) or [0x12, 0, 0, 0, 0, 0][:length]
+        return self._idle_60.get(length) or [0x31, 0, 0, 0, 0, 0][:length]
+
+    def i2c_rdwr(self, *msgs):
+        # Emulate combined transactions: route each message through the
+        # block read/write handlers. Write payloads carry the register byte
+        # first, matching what write_i2c_block_data puts on the wire.
+        for msg in msgs:
+            if msg.flags & 0x0001:  # I2C_M_RD
+                data = self.read_i2c_block_data(msg.addr, 0, msg.len)
+                for i, val in enumerate(data):
+                    msg.buf[i] = bytes([val])
+            else:
+                data = list(msg)
+                self.write_i2c_block_data(msg.addr, data[0] if data else 0, data[1:])
 
     def close(self):
         # No resources to free in the dummy bus
         return
 
 
+# --- Null I2C Bus sentinel ----------------------------------
+class NullBus:
+    """No-op bus returned when the real I2C bus fails to open.
+
+    Implements the same surface as SMBus/DummyBus so callers (notably the
+    E-Stop interrupt path) can dispatch unconditionally instead of
+    guarding every call with `if bus is not None`. It is falsy, so
+    startup code can still tell that no real bus came up.
+    """
+    def write_i2c_block_data(self, addr, register, data):
+        return None
+
+    def write_byte_data(self, addr, register, value):
+        return None
+
+    def read_i2c_block_data(self, addr, register, length):
+        return [0] * length
+
+    def i2c_rdwr(self, *msgs):
+        return None
+
+    def close(self):
+        return None
+
+    def __bool__(self):
+        return False
+
+
+NULL_BUS = NullBus()
+
+
 # ------------------------ Constants -------------------------
 # I2C
 I2C_PICO_ADDR = 0x50  # 80 in decimal
@@ -139,6 +237,31 @@ STATUS_ERROR = 0xFF  # General error (e.g., bad command, bad offset)
 # Sizing
 I2C_BUFFER_SIZE = 6  # Must match the Pico's i2c_mem_buf size
 
+# Set True to dump raw command/status buffers on every transaction
+DEBUG = False
+
+# Pre-compiled structs so hot paths skip the per-call format-string
+# parse: the 16-bit big-endian speed word plus the emulator's 32-bit
+# payload formats
+_U16BE = struct.Struct('>H')
+
+# Direction strings accepted by start_motor
+_DIR_MAP = {"cw": 0, "ccw": 1}
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+
+# Reusable raw buffer for HLFB downloads (255 samples x 4 bytes is the
+# protocol maximum). Allocated once; each capture fills a prefix and
+# decodes it in one shot.
+_HLFB_MAX_BYTES = 255 * 4
+_HLFB_RAW = bytearray(_HLFB_MAX_BYTES)
+
+# Reusable command frame for chunk reads: byte 0 is the register byte the
+# write transaction carries on the wire, byte 1 the command. Only the two
+# offset bytes change between chunks, so the frame is built once.
+_CHUNK_CMD = bytearray(1 + I2C_BUFFER_SIZE)
+_CHUNK_CMD[1] = CMD_READ_HLFB_CHUNK
+
 
 # ----------------- Bus Control Functions ------------------
 
@@ -160,10 +283,10 @@ def init_bus(dev_mode: bool = False):
     except FileNotFoundError:
         print("Error: I2C bus 1 not found.")
         print("Please ensure I2C is enabled on your Raspberry Pi.")
-        return None
+        return NULL_BUS
     except Exception as e:
         print(f"An unexpected error occurred during bus init: {e}")
-        return None
+        return NULL_BUS
 
 
 def close_bus(bus):
@@ -177,6 +300,30 @@ def close_bus(bus):
 
 # ----------------- Motor Control Functions ------------------
 
+def _cmd_and_status(bus, buf, timeout=0.01):
+    """
+    Sends a command buffer and reads the status back in one combined
+    i2c_rdwr transaction (repeated START, no STOP in between). The Pico
+    clock-stretches SCL if it needs time, so no fixed settle sleep is
+    required between command and status.
+
+    If the firmware releases the bus before staging a status (byte 0
+    still zero), micro-poll at 500 us up to `timeout` rather than
+    sleeping a blind fixed interval.
+    """
+    # The leading zero byte is the register byte the write carries on the
+    # wire, matching write_i2c_block_data framing
+    write_msg = i2c_msg.write(I2C_PICO_ADDR, bytes(1) + bytes(buf))
+    read_msg = i2c_msg.read(I2C_PICO_ADDR, I2C_BUFFER_SIZE)
+    bus.i2c_rdwr(write_msg, read_msg)
+    status_buf = bytes(read_msg)
+
+    deadline = time.monotonic() + timeout
+    while status_buf[0] == 0 and time.monotonic() < deadline:
+        time.sleep(0.0005)
+        status_buf = bytes(bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE))
+    return status_buf
+
 def configure_motor():
     print("\n--- Configure Motor ---")
     while True:
@@ -190,6 +337,33 @@ def configure_motor():
             print("Properly defined.")
             return max_speed
 
+@functools.lru_cache(maxsize=8)
+def make_start_cmd_builder(max_speed):
+    """
+    Specializes the start-command build for a fixed max_speed. Returns a
+    closure that turns (operating_speed, ramp_multiplier, direction) into
+    the 6-byte CMD_START_SEQUENCE frame with the speed scale baked in as
+    a closure constant, so repeated starts in a session skip the
+    per-call division and global lookups. Cached per max_speed.
+    """
+    scale = (60 * 65535) / max_speed
+    pack = _U16BE.pack_into
+
+    def build(operating_speed, ramp_multiplier, direction):
+        cmd_speed16 = round(operating_speed * scale)
+        if cmd_speed16 & ~0xFFFF:
+            raise ValueError(
+                f"Calculated duty cycle ({cmd_speed16 / 655.35:.1f}%) is not between 0-100%.")
+        buf = bytearray(I2C_BUFFER_SIZE)
+        buf[0] = CMD_START_SEQUENCE
+        pack(buf, 1, cmd_speed16)
+        buf[3] = ramp_multiplier
+        buf[4] = direction
+        return buf
+
+    return build
+
+
 def start_motor(bus, max_speed, operating_speed=None, ramp_multiplier=None, direction_string=None):
     """
     Asks the user for motor parameters and sends the
@@ -210,42 +384,27 @@ def start_motor(bus, max_speed, operating_speed=None, ramp_multiplier=None, dire
             print("Error: Multiplier must be between 0 and 255.")
             return
 
-        # 2. Calculate 16-bit duty cycle
-        # (operating_speed * 60) gives RPM.
-        # (rpm / max_speed) gives 0.0-1.0 duty cycle.
-        # (* 65535) scales to 16-bit.
-        duty_cycle_float = (operating_speed * 60) / max_speed
-        if not 0.0 <= duty_cycle_float <= 1.0:
-            print(f"Error: Calculated duty cycle ({duty_cycle_float * 100:.1f}%) is not between 0-100%.")
-            print("Check your max_speed and operating_speed.")
-            return
-
-        cmd_speed16 = round(duty_cycle_float * 65535)  # Use 65535 for full 16-bit range
-        
         # Get the direction of the motor
         if direction_string is None:
             direction_string = input("Specify the direction of rotation (cw for clockwise, ccw for counter-clockwise):")
-        match direction_string:
-            case "cw":
-                direction = 0
-            case "ccw":
-                direction = 1
-            case _:
-                print(f"Error: Input does not follow specified parameteres {direction_string}")
-                return
-
-        # 3. Build the command buffer
-        # We create a 6-byte buffer, matching the Pico's.
-        buf = bytearray(I2C_BUFFER_SIZE)
-        buf[0] = CMD_START_SEQUENCE
+        direction = _DIR_MAP.get(direction_string.lower().strip())
+        if direction is None:
+            print(f"Error: Input does not follow specified parameteres {direction_string}")
+            return
 
-        # Pack the 16-bit speed, Big-Endian (>H), into offset 1
-        struct.pack_into('>H', buf, 1, cmd_speed16)
-        buf[3] = ramp_multiplier
-        buf[4] = direction
-        
+        # 2-3. Build the command buffer through the builder specialized
+        # for this max_speed (scale precomputed, cached across calls)
+        build_cmd = make_start_cmd_builder(max_speed)
+        try:
+            buf = build_cmd(operating_speed, ramp_multiplier, direction)
+        except ValueError as e:
+            print(f"Error: {e}")
+            print("Check your max_speed and operating_speed.")
+            return
 
-        print(f"\nSending command buffer: {list(buf)}")
+        cmd_speed16 = (buf[1] << 8) | buf[2]
+        if DEBUG:
+            print("\nSending command buffer:", buf.hex(' '))
         print(f" (16-bit speed: {cmd_speed16}, Multiplier: {ramp_multiplier})")
 
         # 4. Send command and read status
@@ -256,13 +415,8 @@ def start_motor(bus, max_speed, operating_speed=None, ramp_multiplier=None, dire
                 print("Motor start cancelled by user.")
                 return
 
-        bus.write_i2c_block_data(I2C_PICO_ADDR, 0, buf)
-
-        # Give the Pico a moment to process (optional, but safe)
-        time.sleep(0.01)
-
-        # Read the status back
-        status_buf = bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE)
+        # Send the command and read the status in one transaction
+        status_buf = _cmd_and_status(bus, buf)
         print_pico_status(status_buf)
 
     except ValueError:
@@ -281,16 +435,11 @@ def stop_motor(bus):
         buf = bytearray(I2C_BUFFER_SIZE)
         buf[0] = CMD_STOP_SEQUENCE
 
-        print(f"Sending command buffer: {list(buf)}")
-
-        # Send command
-        bus.write_i2c_block_data(I2C_PICO_ADDR, 0, buf)
+        if DEBUG:
+            print("Sending command buffer:", buf.hex(' '))
 
-        # Give the Pico a moment to process
-        time.sleep(0.01)
-
-        # Read the status back
-        status_buf = bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE)
+        # Send the command and read the status in one transaction
+        status_buf = _cmd_and_status(bus, buf)
         print_pico_status(status_buf)
 
     except Exception as e:
@@ -304,12 +453,11 @@ def emergency_stop_motor(bus):
     try:
         buf = bytearray(I2C_BUFFER_SIZE) # Recreates the buffer full of zeros
         buf[0] = CMD_EMERGENCY_STOP # Puts the encoded command into the first index
-        bus.write_i2c_block_data(I2C_PICO_ADDR, 0, buf) # Immediately sends the command to PICO1
-        print(f"Saw an Emergency Stop command buffer: {list(buf)}") # Tells the user it saw an emergency stop command
-        
-        time.sleep(0.01) # Give the Pico a moment to process
-
-        status_buf = bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE)  # Read the status back
+        # Longer status window here: the STOPPED ack must not be missed
+        # under clock stretch while the firmware brakes the motor
+        status_buf = _cmd_and_status(bus, buf, timeout=0.05) # Immediately sends the command to PICO1 and reads the status back
+        if DEBUG:
+            print("Saw an Emergency Stop command buffer:", buf.hex(' ')) # Tells the user it saw an emergency stop command
         print_pico_status(status_buf)
 
     except Exception as e:
@@ -317,6 +465,94 @@ def emergency_stop_motor(bus):
 
 # ----------------- HLFB Control Functions -------------------
 
+def _start_hlfb_capture(bus, num_samples, timeout=10.0):
+    """
+    Sends CMD_RECORD_HLFB and polls until the Pico reports the capture is
+    done. Returns the total byte count ready for chunked readback, or
+    None on error / empty capture / timeout.
+
+    The poll interval backs off exponentially (1 ms doubling to a 50 ms
+    cap, reset whenever the status changes), so short captures return in
+    milliseconds while long ones cost only a handful of wakeups.
+    """
+    buf = bytearray(I2C_BUFFER_SIZE)
+    buf[0] = CMD_RECORD_HLFB
+    buf[1] = num_samples
+
+    if DEBUG:
+        print("Sending command buffer:", buf.hex(' '))
+    bus.write_i2c_block_data(I2C_PICO_ADDR, 0, buf)
+    time.sleep(0.002)  # brief settle; the adaptive poll takes it from here
+
+    print("Waiting for Pico to finish capture...")
+    delay = 0.001
+    deadline = time.monotonic() + timeout
+    last_status = None
+    while True:
+        if time.monotonic() > deadline:
+            print("\nTimed out waiting for capture to finish.")
+            return None
+
+        # Read the Pico's status
+        status_buf = bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE)
+        status = status_buf[0]
+        if status != last_status:
+            delay = 0.001  # state changed; poll quickly again
+            last_status = status
+
+        if status == STATUS_HLFB_CAPTURING:
+            print(".", end="", flush=True)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        elif status == STATUS_HLFB_RECORDED:
+            print("\nCapture complete! Data is ready.")
+            break
+        elif status == STATUS_ERROR:
+            print("\nPico reported an error.")
+            return None
+        elif status == CMD_RECORD_HLFB:
+            print("\nPico is not ready for me. Must wait.")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        else:
+            print(f"\nUnexpected status {hex(status)} while waiting.")
+            return None
+
+    # Data is ready. Read the header info.
+    # status_buf is from the last read, which had STATUS_HLFB_RECORDED
+    num_captured = status_buf[1]
+    total_bytes = status_buf[2] | (status_buf[3] << 8)
+
+    print(f"Pico captured {num_captured} samples ({total_bytes} bytes).")
+
+    if total_bytes == 0:
+        print("Pico reported 0 bytes. Aborting.")
+        return None
+    return total_bytes
+
+
+def _read_hlfb_chunk(bus, offset):
+    """
+    Fetches one 4-byte HLFB chunk with a combined write+read transaction.
+    Returns the raw little-endian float bytes, or None on a bad status.
+    """
+    # The request and readback travel in one ioctl with a repeated START,
+    # replacing two syscalls plus a fixed sleep per chunk. The Pico
+    # clock-stretches SCL while it stages the data.
+    _CHUNK_CMD[2] = offset & 0xFF  # Offset LSB
+    _CHUNK_CMD[3] = (offset >> 8) & 0xFF  # Offset MSB
+
+    write_msg = i2c_msg.write(I2C_PICO_ADDR, _CHUNK_CMD)
+    read_msg = i2c_msg.read(I2C_PICO_ADDR, I2C_BUFFER_SIZE)
+    bus.i2c_rdwr(write_msg, read_msg)
+    raw = bytes(read_msg)
+
+    if raw[0] == STATUS_HLFB_DATA_CHUNK:
+        return raw[1:5]
+    print(f"Error: Expected DATA_CHUNK at offset {offset}, got {hex(raw[0])}")
+    return None
+
+
 def capture_and_read_hlfb(bus, num_samples=None):
     """
     Handles the full HLFB capture and readback sequence.
@@ -331,81 +567,32 @@ def capture_and_read_hlfb(bus, num_samples=None):
             print("Error: Samples must be between 1 and 255.")
             return
 
-        # 1. Send the "Record" command
-        buf = bytearray(I2C_BUFFER_SIZE)
-        buf[0] = CMD_RECORD_HLFB
-        buf[1] = num_samples
-
-        print(f"Sending command buffer: {list(buf)}")
-        bus.write_i2c_block_data(I2C_PICO_ADDR, 0, buf)
-        time.sleep(1)  # Wait 100ms before polling again
-
-        # 2. Poll for "Capture Done" status
-        print("Waiting for Pico to finish capture...")
-        status_buf = bytearray(I2C_BUFFER_SIZE)
-        while True:
-            # Read the Pico's status
-            status_buf = bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE)
-            status = status_buf[0]
-
-            if status == STATUS_HLFB_CAPTURING:
-                print(".", end="", flush=True)
-                time.sleep(0.1)  # Wait 100ms before polling again
-            elif status == STATUS_HLFB_RECORDED:
-                print("\nCapture complete! Data is ready.")
-                break
-            elif status == STATUS_ERROR:
-                print("\nPico reported an error.")
-                return
-            elif status == CMD_RECORD_HLFB: # <--- This line likely had the inconsistent indentation
-                print("\nPico is not ready for me. Must wait.")
-                time.sleep(1)  # Wait 100ms before polling again
-            else:
-                print(f"\nUnexpected status {hex(status)} while waiting.")
-                return
-
-        # 3. Data is ready. Read the header info.
-        # status_buf is from the last read, which had STATUS_HLFB_RECORDED
-        num_captured = status_buf[1]
-        total_bytes = status_buf[2] | (status_buf[3] << 8)
-
-        print(f"Pico captured {num_captured} samples ({total_bytes} bytes).")
-
-        if total_bytes == 0:
-            print("Pico reported 0 bytes. Aborting.")
+        total_bytes = _start_hlfb_capture(bus, num_samples)
+        if total_bytes is None:
             return
 
-        # 4. Loop and read data in 4-byte chunks
-        results = []
+        # Loop and read data in 4-byte chunks into the reusable raw
+        # buffer; the float decode happens once at the end instead of a
+        # struct.unpack per sample
+        filled = 0
         print("Reading data chunks...")
         for offset in range(0, total_bytes, 4):
-            # 4a. Send the "Read Chunk" command
-            cmd_buf = bytearray(I2C_BUFFER_SIZE)
-            cmd_buf[0] = CMD_READ_HLFB_CHUNK
-            cmd_buf[1] = offset & 0xFF  # Offset LSB
-            cmd_buf[2] = (offset >> 8) & 0xFF  # Offset MSB
-            
-            # print(f"DEBUG: Type of cmd_buf is {type(cmd_buf)}")
-            bus.write_i2c_block_data(I2C_PICO_ADDR, 0, cmd_buf)
-            time.sleep(0.001)
-
-            # 4b. Immediately read back the chunk
-            data_buf = bus.read_i2c_block_data(I2C_PICO_ADDR, 0, I2C_BUFFER_SIZE)
-
-            if data_buf[0] == STATUS_HLFB_DATA_CHUNK:
-                # Unpack the 4-byte float (Little-Endian '<f') from offset 1
-                val = struct.unpack_from('<f', bytearray(data_buf), 1)[0]
-                results.append(val)
-            else:
-                print(f"Error: Expected DATA_CHUNK at offset {offset}, got {hex(data_buf[0])}")
+            chunk = _read_hlfb_chunk(bus, offset)
+            if chunk is None:
                 break
+            _HLFB_RAW[filled:filled + 4] = chunk
+            filled += 4
+
+        # Single zero-copy decode of the collected floats. The view stays
+        # valid until the next capture reuses the buffer; callers that keep
+        # data long-term (the GUI) copy it into their own storage.
+        results = np.frombuffer(memoryview(_HLFB_RAW), dtype='<f4', count=filled // 4)
 
-        # 5. Print results
+        # Print results in one write instead of one syscall per sample
         print("\n--- Captured HLFB Data ---")
-        for i, val in enumerate(results):
-            print(f"Sample {i:03d}: {val:.6f}")
+        print("\n".join(f"Sample {i:03d}: {val:.6f}" for i, val in enumerate(results)))
         print("----------------------------")
-        
+
         return results
 
     except ValueError:
@@ -414,26 +601,105 @@ def capture_and_read_hlfb(bus, num_samples=None):
         print(f"An I2C error occurred: {e}")
 
 
+def stream_hlfb_to_csv(bus, path, num_samples=255, block_samples=128, queue_depth=4):
+    """
+    Captures HLFB data and streams the samples straight into a CSV file
+    as they arrive, instead of accumulating the whole capture in memory
+    and serializing it later. A writer thread consumes sample blocks from
+    a bounded queue, so the disk write overlaps the I2C readback and
+    neither side stalls the other.
+
+    Returns True if the full capture was written.
+    """
+    print("\n--- Start HLFB Capture (streaming to CSV) ---")
+    try:
+        if not 1 <= num_samples <= 255:
+            print("Error: Samples must be between 1 and 255.")
+            return False
+
+        total_bytes = _start_hlfb_capture(bus, num_samples)
+        if total_bytes is None:
+            return False
+
+        blocks = queue.Queue(maxsize=queue_depth)
+        writer_error = []  # one-slot holder; checked after join
+
+        def _writer():
+            try:
+                with open(path, mode='w', buffering=1 << 20, newline='') as f:
+                    w = csv.writer(f)
+                    w.writerow(["Sample", "HLFB"])
+                    idx = 0
+                    while True:
+                        block = blocks.get()
+                        if block is None:
+                            return
+                        vals = np.frombuffer(block, dtype='<f4')
+                        w.writerows((idx + i + 1, v) for i, v in enumerate(vals))
+                        idx += len(vals)
+            except Exception as e:
+                writer_error.append(e)
+                # Keep draining until the shutdown sentinel so the
+                # producer can never block on a full queue
+                while blocks.get() is not None:
+                    pass
+
+        writer_thread = threading.Thread(target=_writer, daemon=True)
+        writer_thread.start()
+
+        ok = True
+        pending = bytearray()
+        for offset in range(0, total_bytes, 4):
+            if writer_error:
+                ok = False
+                break
+            chunk = _read_hlfb_chunk(bus, offset)
+            if chunk is None:
+                ok = False
+                break
+            pending += chunk
+            if len(pending) >= block_samples * 4:
+                blocks.put(bytes(pending))
+                pending.clear()
+        if ok and pending:
+            blocks.put(bytes(pending))
+        blocks.put(None)  # writer shutdown sentinel
+        writer_thread.join()
+
+        if writer_error:
+            print(f"Error: CSV writer failed: {writer_error[0]}")
+            return False
+        if ok:
+            print(f"Streamed capture written to {path}")
+        return ok
+
+    except Exception as e:
+        print(f"An I2C error occurred: {e}")
+        return False
+
+
 # ------------------- Utility Functions --------------------
 
+# Prebuilt status lines keyed by status byte; MOTOR_RUNNING is the only
+# status that needs data decoded from the buffer, so it stays special
+_STATUS_LINES = {
+    STATUS_MOTOR_STOPPED: "Pico Status: MOTOR_STOPPED",
+    STATUS_HLFB_RECORDED: "Pico Status: HLFB_RECORDED (Data ready)",
+    STATUS_HLFB_CAPTURING: "Pico Status: HLFB_CAPTURING (Busy)",
+    STATUS_ERROR: "Pico Status: ERROR",
+}
+
+
 def print_pico_status(buf):
     """
     Decodes and prints the status from a read buffer.
     """
     status = buf[0]
     if status == STATUS_MOTOR_RUNNING:
-        speed = (buf[1] << 8) | buf[2]
-        print(f"Pico Status: MOTOR_RUNNING (Speed: {speed})")
-    elif status == STATUS_MOTOR_STOPPED:
-        print("Pico Status: MOTOR_STOPPED")
-    elif status == STATUS_HLFB_RECORDED:
-        print("Pico Status: HLFB_RECORDED (Data ready)")
-    elif status == STATUS_HLFB_CAPTURING:
-        print("Pico Status: HLFB_CAPTURING (Busy)")
-    elif status == STATUS_ERROR:
-        print("Pico Status: ERROR")
+        print(f"Pico Status: MOTOR_RUNNING (Speed: {(buf[1] << 8) | buf[2]})")
     else:
-        print(f"Pico Status: Unknown ({hex(status)})")
-    print(f"Full buffer: {list(buf)}")
+        print(_STATUS_LINES.get(status) or f"Pico Status: Unknown ({status:#x})")
+    if DEBUG:
+        print("Full buffer:", bytes(buf).hex(' '))
 
 
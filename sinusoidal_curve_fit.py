@@ -1,7 +1,96 @@
+import math
+import os
+import sys
 import numpy as np
-from scipy.optimize import leastsq
+from scipy.optimize import least_squares
+import matplotlib
+# Headless runs (no X display on the Pi / over plain SSH) use the Agg
+# backend so plotting never tries to boot a GUI event loop.
+if os.name == 'posix' and not os.environ.get('DISPLAY'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
+# Numba is optional (it is a heavy install on a Pi). When present, the
+# residual evaluation is JIT-compiled into one fused loop with no
+# temporary arrays; otherwise the plain numpy expressions are used.
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    # The explicit signature makes numba compile at import instead of on
+    # the first fit, and cache=True persists the compiled artifact to
+    # __pycache__ so later runs skip LLVM entirely
+    @njit("float64[:](float64, float64, float64, float64, float64[:], float64[:], float64[:])",
+          fastmath=True, cache=True)
+    def _residuals_kernel(amplitude, frequency, phase, mean, t, data, out):
+        for i in range(t.shape[0]):
+            out[i] = data[i] - (amplitude * math.sin(frequency * t[i] + phase) + mean)
+        return out
+
+
+if _HAVE_NUMBA:
+    @njit("void(float64, float64, float64, float64, float64[:], float64[:], float64[:], float64[:,:])",
+          fastmath=True, cache=True)
+    def _res_jac_kernel(amplitude, frequency, phase, mean, t, data, res, jac):
+        # One pass produces the residual and all four Jacobian columns,
+        # keeping sin/cos in registers instead of five separate numpy
+        # sweeps with their temporaries
+        for i in range(t.shape[0]):
+            s = math.sin(frequency * t[i] + phase)
+            c = math.cos(frequency * t[i] + phase)
+            res[i] = data[i] - (amplitude * s + mean)
+            jac[i, 0] = -s
+            jac[i, 1] = -amplitude * t[i] * c
+            jac[i, 2] = -amplitude * c
+            jac[i, 3] = -1.0
+
+    @njit(cache=True)
+    def _peak_bin(c):
+        # Index of the largest-magnitude bin, skipping DC. Comparing
+        # magnitude squared gives the same argmax as |c| without a sqrt
+        # per bin or an N-wide temporary.
+        best = -1.0
+        k = 1
+        for i in range(1, c.shape[0]):
+            m = c[i].real * c[i].real + c[i].imag * c[i].imag
+            if m > best:
+                best = m
+                k = i
+        return k
+
+    @njit("float64[:](float64, float64, float64, float64, float64[:], float64[:])",
+          fastmath=True, cache=True)
+    def _model_kernel(amplitude, frequency, phase, mean, t, out):
+        for i in range(t.shape[0]):
+            out[i] = amplitude * math.sin(frequency * t[i] + phase) + mean
+        return out
+
+    @njit(fastmath=True, cache=True)
+    def _gen_noisy_kernel(N, amplitude, frequency, phase, mean, noise, out_t, out):
+        # One fused pass writes the time base and the noisy samples
+        # together instead of three separate array traversals
+        for i in range(N):
+            ti = 2 * math.pi * i / (N - 1)
+            out_t[i] = ti
+            out[i] = amplitude * math.sin(frequency * ti + phase) + mean + noise[i]
+
+
+# Scratch output buffers keyed by sample count: leastsq evaluates the
+# residual dozens of times per fit over the same-length arrays, so the
+# buffer is allocated once per size instead of once per call
+_residual_scratch = {}
+
+
+def _scratch_for(n):
+    out = _residual_scratch.get(n)
+    if out is None:
+        out = _residual_scratch[n] = np.empty(n)
+    return out
+
 
 def sinusoidal_model(t, amplitude, frequency, phase, mean):
     """
@@ -15,15 +104,21 @@ def generate_noisy_data(N, true_amplitude, true_frequency, true_phase, true_mean
     """
     Generates a set of noisy sinusoidal data points for demonstration.
     """
+    noise = noise_level * np.random.randn(N)
+
+    if _HAVE_NUMBA:
+        t = np.empty(N)
+        noisy_data = np.empty(N)
+        _gen_noisy_kernel(N, true_amplitude, true_frequency, true_phase,
+                          true_mean, noise, t, noisy_data)
+        return t, noisy_data
+
     # Create the time array
     t = np.linspace(0, 2 * np.pi, N)
 
-    # Generate the "perfect" data
-    perfect_data = sinusoidal_model(t, true_amplitude, true_frequency, true_phase, true_mean)
-
-    # Create noise and add it to the data
-    noise = noise_level * np.random.randn(N)
-    noisy_data = perfect_data + noise
+    # Generate the "perfect" data and add the noise
+    noisy_data = sinusoidal_model(t, true_amplitude, true_frequency, true_phase, true_mean)
+    noisy_data += noise
 
     return t, noisy_data
 
@@ -45,12 +140,20 @@ def estimate_initial_guess(t, data):
     N = len(t)
     dt = t[1] - t[0]  # Get the time step
 
-    # Compute the FFT
-    fft_data = np.fft.fft(data - guess_mean)
-    fft_freqs = np.fft.fftfreq(N, dt)
-
-    # Find the frequency (in Hz) with the highest power (ignoring the DC component at index 0)
-    dominant_freq_index = np.argmax(np.abs(fft_data[1:N // 2])) + 1
+    # Compute the FFT. The input is real, so rfft produces just the
+    # positive-frequency half the full FFT would mirror anyway -- half
+    # the FLOPs and half the memory traffic.
+    fft_data = np.fft.rfft(data - guess_mean)
+    fft_freqs = np.fft.rfftfreq(N, dt)
+
+    # Find the frequency (in Hz) with the highest power (ignoring the DC
+    # component at index 0). Magnitude squared has the same argmax as the
+    # magnitude, so both paths skip the per-bin sqrt.
+    if _HAVE_NUMBA:
+        dominant_freq_index = _peak_bin(fft_data)
+    else:
+        mag2 = fft_data.real ** 2 + fft_data.imag ** 2
+        dominant_freq_index = int(np.argmax(mag2[1:])) + 1
     guess_frequency_hz = fft_freqs[dominant_freq_index]
 
     # Convert from Hz (cycles/second) to angular frequency (radians/second)
@@ -62,13 +165,90 @@ def estimate_initial_guess(t, data):
     return initial_guess
 
 
+def linear_fit_known_frequency(t, data, frequency):
+    """
+    Closed-form least squares fit for a sinusoid with a known frequency.
+
+    With the frequency fixed, A*sin(f*t + phase) + mean is linear in
+    [A*cos(phase), A*sin(phase), mean], so one lstsq solve of an Nx3
+    design matrix replaces the iterative nonlinear search.
+
+    Returns:
+        list: [amplitude, frequency, phase, mean]
+    """
+    design = np.column_stack([np.sin(frequency * t),
+                              np.cos(frequency * t),
+                              np.ones_like(t)])
+    coeffs, *_ = np.linalg.lstsq(design, data, rcond=None)
+
+    amplitude = np.hypot(coeffs[0], coeffs[1])
+    phase = np.arctan2(coeffs[1], coeffs[0])
+    mean = coeffs[2]
+    return [amplitude, frequency, phase, mean]
+
+
 def residuals(params, t, data):
     """
     Calculates the residual error between the model and the data.
+
+    Uses the fused Numba kernel when available (one loop, no temporary
+    arrays for the mul/sin/add/sub chain); falls back to numpy otherwise.
     """
     amplitude, frequency, phase, mean = params
-    model_output = sinusoidal_model(t, amplitude, frequency, phase, mean)
-    return data - model_output
+    if _HAVE_NUMBA:
+        out = _scratch_for(t.shape[0])
+        return _residuals_kernel(amplitude, frequency, phase, mean, t, data, out)
+    sin_arg, _ = _sin_cos(frequency, phase, t)
+    return data - (amplitude * sin_arg + mean)
+
+
+# Single-entry sin/cos cache: the solver evaluates the residual and the
+# Jacobian at the same parameter vector, so the trig pass over t is done
+# once and shared between the two
+_trig_key = None
+_trig_val = None
+_trig_arg = None
+
+
+def _sin_cos(frequency, phase, t):
+    """
+    sin/cos of (frequency * t + phase), computed into reused buffers.
+
+    t is fixed for the whole fit, so across iterations only the scalar
+    multiply-and-shift of the argument changes; the out= forms keep the
+    evaluation to three passes over preallocated memory with no
+    temporaries. The returned arrays are overwritten on the next call
+    with different parameters -- callers must not hold them across
+    iterations.
+    """
+    global _trig_key, _trig_val, _trig_arg
+    key = (float(frequency), float(phase), t.shape[0])
+    if key != _trig_key:
+        if _trig_arg is None or _trig_arg.shape[0] != t.shape[0]:
+            _trig_arg = np.empty(t.shape[0])
+            _trig_val = (np.empty_like(_trig_arg), np.empty_like(_trig_arg))
+        np.multiply(t, frequency, out=_trig_arg)
+        _trig_arg += phase
+        np.sin(_trig_arg, out=_trig_val[0])
+        np.cos(_trig_arg, out=_trig_val[1])
+        _trig_key = key
+    return _trig_val
+
+
+def residuals_jacobian(params, t, data):
+    """
+    Analytic Jacobian of `residuals` with respect to the parameters.
+
+    Supplying this to the solver avoids the 4 extra residual evaluations
+    per iteration (each a full np.sin over the data) that the numerical
+    finite-difference estimate would cost.
+    """
+    amplitude, frequency, phase, _ = params
+    sin_arg, cos_arg = _sin_cos(frequency, phase, t)
+    return np.column_stack([-sin_arg,
+                            -amplitude * t * cos_arg,
+                            -amplitude * cos_arg,
+                            -np.ones_like(t)])
 
 
 def _plot_fit_results(t, data, initial_guess, fitted_params):
@@ -79,11 +259,25 @@ def _plot_fit_results(t, data, initial_guess, fitted_params):
     guess_amp, guess_freq, guess_phase, guess_mean = initial_guess
     fit_amp, fit_freq, fit_phase, fit_mean = fitted_params
 
-    # Create the data for the plot lines
-    fine_t = np.linspace(t.min(), t.max(), 500)
-
-    data_first_guess = sinusoidal_model(t, guess_amp, guess_freq, guess_phase, guess_mean)
-    data_fit = sinusoidal_model(fine_t, fit_amp, fit_freq, fit_phase, fit_mean)
+    # Create the data for the plot lines. The time array is monotonically
+    # increasing, so the endpoints are t[0]/t[-1] -- no full min/max scan.
+    # Size the fine grid from the fitted frequency (20 points per cycle,
+    # floor of 200) instead of a fixed 500: low-frequency fits stop
+    # oversampling and fast ones stop aliasing.
+    n_cycles = abs(fit_freq) * (t[-1] - t[0]) / (2 * np.pi)
+    n_fine = max(200, int(20 * n_cycles))
+    fine_t = np.linspace(t[0], t[-1], n_fine)
+
+    # Fused single-pass evaluation when numba is around; the numpy
+    # expression (with its temporaries) otherwise
+    if _HAVE_NUMBA:
+        data_first_guess = _model_kernel(guess_amp, guess_freq, guess_phase,
+                                         guess_mean, t, np.empty_like(t))
+        data_fit = _model_kernel(fit_amp, fit_freq, fit_phase,
+                                 fit_mean, fine_t, np.empty_like(fine_t))
+    else:
+        data_first_guess = sinusoidal_model(t, guess_amp, guess_freq, guess_phase, guess_mean)
+        data_fit = sinusoidal_model(fine_t, fit_amp, fit_freq, fit_phase, fit_mean)
 
     # Create the plot
     plt.figure(figsize=(12, 7))
@@ -96,7 +290,11 @@ def _plot_fit_results(t, data, initial_guess, fitted_params):
     plt.ylabel('Amplitude')
     plt.legend()
     plt.grid(True, linestyle=':')
-    plt.show()
+    if matplotlib.get_backend().lower() == 'agg':
+        plt.savefig('sinusoidal_fit.png')
+        print("Headless backend: plot saved to sinusoidal_fit.png")
+    else:
+        plt.show()
 
 
 def fit_sinusoidal_to_data(t, data, show_plot=False):
@@ -115,8 +313,11 @@ def fit_sinusoidal_to_data(t, data, show_plot=False):
               [fit_amplitude, fit_frequency, fit_phase, fit_mean]
     """
     print("--- Starting Sinusoidal Fit ---")
-    t = np.array(t)
-    data = np.array(data)
+    # float64 up front: the compiled residual kernel has a fixed float64
+    # signature, and integer input (e.g. raw sample indices as time)
+    # would otherwise fail to dispatch
+    t = np.asarray(t, dtype=np.float64)
+    data = np.asarray(data, dtype=np.float64)
 
     # ---------------------- 1. Make Initial Guess -------------------------
     initial_guess = estimate_initial_guess(t, data)
@@ -125,8 +326,59 @@ def fit_sinusoidal_to_data(t, data, show_plot=False):
           f"Guess Phase: {initial_guess[2]:.4f}, Guess Mean: {initial_guess[3]:.4f}\n")
 
     # --------------------- 2. Run Optimization ----------------------------
+    # With the FFT frequency estimate in hand, a single closed-form linear
+    # solve is usually enough. Fall back to the iterative nonlinear solver
+    # whenever the linear fit leaves a non-trivial fraction of the signal
+    # unexplained: FFT bin quantization alone can put the frequency 10-15%
+    # off on short records, which leaves ~30% of the energy in the
+    # residual, so the gate must sit well below that for refinement to
+    # fire when it matters.
     try:
-        fitted_params, _ = leastsq(residuals, initial_guess, args=(t, data))
+        fitted_params = linear_fit_known_frequency(t, data, initial_guess[1])
+        fit_residual = np.linalg.norm(residuals(fitted_params, t, data))
+        signal_energy = np.linalg.norm(data - np.mean(data))
+
+        if signal_energy > 0 and fit_residual > 0.15 * signal_energy:
+            print("Linear fit residual too high; refining with least_squares...")
+            # Physically sensible box around the FFT estimate: non-negative
+            # amplitude, frequency within a decade of the guess, phase on
+            # the principal branch. Keeps the solver from wandering into
+            # 2*pi aliases and converging back, which costs iterations.
+            ga = abs(float(initial_guess[0])) or 1.0
+            gf = abs(float(initial_guess[1])) or 1.0
+            bounds = ([0.0, 0.1 * gf, -np.pi, -np.inf],
+                      [10.0 * ga, 10.0 * gf, np.pi, np.inf])
+            if _HAVE_NUMBA:
+                # Fused evaluation: the solver asks for the residual and
+                # the Jacobian at the same point, so one kernel pass fills
+                # both buffers and the second request is a cache hit.
+                # Copies are returned because the solver keeps references
+                # to previous evaluations.
+                res_buf = np.empty_like(t)
+                jac_buf = np.empty((t.shape[0], 4))
+                eval_key = [None]
+
+                def _ensure(params):
+                    key = tuple(params)
+                    if eval_key[0] != key:
+                        _res_jac_kernel(params[0], params[1], params[2], params[3],
+                                        t, data, res_buf, jac_buf)
+                        eval_key[0] = key
+
+                def _fun(params):
+                    _ensure(params)
+                    return res_buf.copy()
+
+                def _jac(params):
+                    _ensure(params)
+                    return jac_buf.copy()
+
+                result = least_squares(_fun, initial_guess, jac=_jac,
+                                       method='trf', bounds=bounds)
+            else:
+                result = least_squares(residuals, initial_guess, jac=residuals_jacobian,
+                                       args=(t, data), method='trf', bounds=bounds)
+            fitted_params = result.x
 
         print("--- Fitted Parameters ---")
         print(f"Fitted Amplitude: {fitted_params[0]:.4f}, Fitted Frequency: {fitted_params[1]:.4f}, "
@@ -188,5 +440,8 @@ if __name__ == "__main__":
     
     fit_sinusoidal_to_data(corrected_time, corrected_data, True)
 
-    input("\nPress Enter to Exit Program: ")
+    # Only hold the window open for an interactive terminal; piped or
+    # automated runs shouldn't block on stdin
+    if sys.stdin.isatty():
+        input("\nPress Enter to Exit Program: ")
     exit()
\ No newline at end of file